@@ -2,105 +2,320 @@
 """Direct implementation to create table of contents - bypasses rate limit issues"""
 
 import os
+import re
 import json
+import fnmatch
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+
+# Vendored/tool directories that are never part of the project listing.
+# Checked by name before any pattern matching so their subtrees are never read.
+PRUNE_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules', '.venv', 'venv', '.tox',
+    '.mypy_cache', '.pytest_cache', 'dist', 'build', '.grok',
+})
+
+GLOB_CHARS = frozenset('*?[')
+
+def _path_glob(pattern):
+    """Translate a glob matched against a path into an unanchored regex.
+
+    As in git, ``*``, ``?`` and ``[...]`` never match ``/``, while ``**``
+    spans any number of directories (``a/**/b`` also matches ``a/b``).
+    """
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+            continue
+        if c == '*':
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            # A ']' straight after '[' (or '[!') is part of the set
+            j = i + 2 if pattern.startswith('[!', i) else i + 1
+            j = pattern.find(']', j + 1)
+            if j == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:j].replace('\\', '\\\\')
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                elif body.startswith('^'):
+                    body = '\\' + body
+                out.append('(?!/)[' + body + ']')
+                i = j
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return ''.join(out)
 
 def load_gitignore_patterns():
-    """Load patterns from .gitignore file."""
-    patterns = []
+    """Load patterns from .gitignore file and compile them by match scope.
+
+    Returns a tuple of ``(kind, value)`` pairs so the hot loop is a flat
+    dispatch, cheapest checks first:
+
+    - ``'names'``: frozenset of literal basenames (``Cargo.lock``, ``.venv``)
+    - ``'suffix'``: tuple of literal suffixes from ``*.ext`` patterns
+    - ``'dir'``: directory-only patterns (``foo/``), tested once per directory
+    - ``'path'``: literals and globs containing ``/``, tested on relative paths
+    - ``'name'``: other globs, tested against the basename only
+
+    A leading ``/`` anchors the pattern to the root of the walk. Globs are
+    translated once to regexes that match case-sensitively like
+    ``fnmatchcase`` (no per-call ``normcase``), as git does on Linux; in
+    globs tested on paths ``*`` stays within one directory (``_path_glob``).
+    """
+    names = set()
+    suffixes = []
+    dir_parts = []
+    path_parts = []
+    name_parts = []
     if os.path.exists('.gitignore'):
         with open('.gitignore', 'r') as f:
             for line in f:
                 line = line.strip()
-                if line and not line.startswith('#'):
-                    patterns.append(line)
-    return patterns
-
-def should_ignore(path, patterns):
-    """Check if a path should be ignored based on gitignore patterns."""
-    for pattern in patterns:
-        if pattern.endswith('/'):
-            if path.startswith(pattern) or ('/' + pattern) in path:
+                if not line or line.startswith('#'):
+                    continue
+                anchored = line.startswith('/')
+                if anchored:
+                    line = line[1:]
+                is_glob = not GLOB_CHARS.isdisjoint(line)
+                if line.endswith('/'):
+                    body = line[:-1]
+                    body = _path_glob(body) if is_glob else re.escape(body)
+                    dir_parts.append(('^' if anchored else '(?:^|/)') + body + '/')
+                    continue
+                
+                if anchored:
+                    path_parts.append('^' + (_path_glob(line) if is_glob else re.escape(line)) + r'\Z')
+                elif not is_glob:
+                    if '/' in line:
+                        path_parts.append(re.escape(line))
+                    else:
+                        names.add(line)
+                elif line.startswith('*') and '/' not in line and GLOB_CHARS.isdisjoint(line[1:]):
+                    suffixes.append(line[1:])
+                elif '/' in line:
+                    path_parts.append('^' + _path_glob(line) + r'\Z')
+                else:
+                    name_parts.append(fnmatch.translate(line))
+    
+    patterns = []
+    if names:
+        patterns.append(('names', frozenset(names)))
+    if suffixes:
+        patterns.append(('suffix', tuple(suffixes)))
+    for kind, parts in (('dir', dir_parts), ('path', path_parts), ('name', name_parts)):
+        if parts:
+            patterns.append((kind, re.compile('(?:%s)' % '|'.join(parts))))
+    return tuple(patterns)
+
+def should_ignore(path, patterns, name=None):
+    """Check if a file path should be ignored based on compiled gitignore patterns.
+
+    Directory-only patterns are not tested here: they are applied once per
+    directory by ``_dir_ignored``, which prunes the whole subtree. Callers
+    that already know the basename should pass it as ``name``.
+    """
+    if name is None:
+        name = path.rpartition('/')[2]
+    for kind, value in patterns:
+        if kind == 'names':
+            if name in value:
                 return True
-        elif pattern in path or path.endswith(pattern):
-            return True
-        elif '*' in pattern:
-            import fnmatch
-            if fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(os.path.basename(path), pattern):
+        elif kind == 'suffix':
+            if name.endswith(value):
+                return True
+        elif kind == 'path':
+            if value.search(path):
+                return True
+        elif kind == 'name':
+            if value.match(name):
                 return True
     return False
 
+@lru_cache(maxsize=4096)
+def _dir_ignored(relpath, patterns, name=None):
+    """Decide once whether a directory (and so its whole subtree) is ignored."""
+    for kind, value in patterns:
+        if kind == 'dir' and value.search(relpath + '/'):
+            return True
+    return should_ignore(relpath, patterns, name)
+
 def list_files_recursive(directory="."):
     """Recursively list all files in directory respecting .gitignore."""
     gitignore_patterns = load_gitignore_patterns()
     all_files = []
     
-    for root, dirs, files in os.walk(directory):
-        # Remove directories that should be ignored
-        dirs[:] = [d for d in dirs if not should_ignore(os.path.join(root, d), gitignore_patterns)]
-        
-        for file in files:
-            file_path = os.path.join(root, file)
-            relative_path = os.path.relpath(file_path, directory)
-            
-            if not should_ignore(relative_path, gitignore_patterns):
-                all_files.append(relative_path)
+    # Bind the per-entry callables as locals (LOAD_FAST) for the hot loop
+    scandir = os.scandir
+    sep = os.sep
+    prune_dirs = PRUNE_DIRS
+    dir_ignored = _dir_ignored
+    file_ignored = should_ignore
+    append = all_files.append
+    
+    # Walk with os.scandir so entry types come straight from the directory
+    # listing instead of an extra stat() per entry. Each stack item carries
+    # the relative prefix so relative paths are built without relpath().
+    stack = [(directory, "")]
+    while stack:
+        current, prefix = stack.pop()
+        try:
+            with scandir(current) as entries:
+                for entry in entries:
+                    name = entry.name
+                    relative_path = prefix + name
+                    if entry.is_dir(follow_symlinks=False):
+                        # Vendored and ignored directories are pruned before descending
+                        if name in prune_dirs:
+                            continue
+                        if not dir_ignored(relative_path, gitignore_patterns, name):
+                            stack.append((entry.path, relative_path + sep))
+                    elif not entry.is_dir():
+                        # Like os.walk: every non-directory is listed, including
+                        # symlinks to files; symlinked directories are skipped
+                        if not file_ignored(relative_path, gitignore_patterns, name):
+                            append(relative_path)
+        except OSError:
+            continue
     
     return all_files
 
+# Fixed descriptions for well-known files, keyed by lower-cased name
+SPECIAL_NAMES = {
+    'readme.md': "Main project documentation and overview",
+    'setup.py': "Python package setup and installation configuration",
+    'requirements.txt': "Python package dependencies list",
+    '.gitignore': "Git ignore patterns for version control",
+    'license': "Project license terms and conditions",
+    'dockerfile': "Docker container build instructions",
+}
+
+# Well-known Python module names
+PYTHON_NAMES = {
+    '__init__.py': "Python package initialization file",
+    'cli.py': "Command-line interface implementation",
+    'main.py': "Main application entry point",
+}
+
+# Description templates by extension; {stem} is the name without extension
+# (underscores as spaces) and {kind} is the upper-cased extension
+EXT_DESCRIPTIONS = {
+    '.json': "Configuration file - {stem}",
+    '.yaml': "Configuration file - {stem}",
+    '.yml': "Configuration file - {stem}",
+    '.toml': "Configuration file - {stem}",
+    '.ini': "Configuration file - {stem}",
+    '.cfg': "Configuration file - {stem}",
+    '.md': "Documentation - {stem}",
+    '.rst': "Documentation - {stem}",
+    '.txt': "Documentation - {stem}",
+    '.html': "Web asset - {kind} file",
+    '.css': "Web asset - {kind} file",
+    '.js': "Web asset - {kind} file",
+    '.csv': "Data file - {kind} format",
+    '.xml': "Data file - {kind} format",
+    '.sql': "Data file - {kind} format",
+}
+
+_UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
+
+def _describe_python(name, name_lower, ext):
+    stem = name[:-3]
+    if 'test' in name_lower:
+        return f"Test file - {stem.replace('test_', '').translate(_UNDERSCORE_TO_SPACE)}"
+    return PYTHON_NAMES.get(name) or f"Python module - {stem.translate(_UNDERSCORE_TO_SPACE)}"
+
+def _describe_from_template(name, name_lower, ext):
+    template = EXT_DESCRIPTIONS.get(ext)
+    if template:
+        return template.format(
+            stem=name[:-len(ext)].translate(_UNDERSCORE_TO_SPACE),
+            kind=ext[1:].upper()
+        )
+    return f"File - {name}"
+
+def _describe_document(name, name_lower, ext):
+    if 'readme' in name_lower:
+        return "Documentation file"
+    return _describe_from_template(name, name_lower, ext)
+
+# Per-extension description handlers; anything else uses the template table
+EXT_HANDLERS = {
+    '.py': _describe_python,
+    '.md': _describe_document,
+    '.rst': _describe_document,
+    '.txt': _describe_document,
+}
+
+# Extensions counted as configuration in the summary (a tuple so it can be
+# passed straight to str.endswith)
+CONFIG_EXTS = ('.json', '.yaml', '.yml', '.toml', '.ini')
+
 def describe_file(filepath):
     """Generate a description for a file based on its name and extension."""
-    name = os.path.basename(filepath)
-    ext = os.path.splitext(filepath)[1].lower()
-    
-    # Special files
-    if name.lower() == 'readme.md':
-        return "Main project documentation and overview"
-    elif name.lower() == 'setup.py':
-        return "Python package setup and installation configuration"
-    elif name.lower() == 'requirements.txt':
-        return "Python package dependencies list"
-    elif name.lower() == '.gitignore':
-        return "Git ignore patterns for version control"
-    elif name.lower() == 'license':
-        return "Project license terms and conditions"
-    elif name.lower() == 'dockerfile':
-        return "Docker container build instructions"
+    name = filepath.rpartition(os.sep)[2]
+    name_lower = name.lower()
+    dot = name.rfind('.')
+    ext = name_lower[dot:] if dot > 0 else ''
     
-    # Python files
-    elif ext == '.py':
-        if 'test' in name.lower():
-            return f"Test file - {name.replace('.py', '').replace('test_', '').replace('_', ' ')}"
-        elif name == '__init__.py':
-            return "Python package initialization file"
-        elif name == 'cli.py':
-            return "Command-line interface implementation"
-        elif name == 'main.py':
-            return "Main application entry point"
-        else:
-            return f"Python module - {name.replace('.py', '').replace('_', ' ')}"
-    
-    # Configuration files
-    elif ext in ['.json', '.yaml', '.yml', '.toml', '.ini', '.cfg']:
-        return f"Configuration file - {name.replace(ext, '').replace('_', ' ')}"
-    
-    # Documentation
-    elif ext in ['.md', '.rst', '.txt']:
-        if 'readme' in name.lower():
-            return "Documentation file"
-        else:
-            return f"Documentation - {name.replace(ext, '').replace('_', ' ')}"
+    special = SPECIAL_NAMES.get(name_lower)
+    if special:
+        return special
+    return EXT_HANDLERS.get(ext, _describe_from_template)(name, name_lower, ext)
+
+def _toc_lines(dirs, all_files):
+    """Yield the lines of tableofcontents.md, each ending in a newline.
+
+    ``dirs`` maps a directory (``"."`` for the root) to its files. Lines are
+    produced lazily so the writer can stream them without holding the
+    whole document.
+    """
+    yield "# Grok CLI - Project Table of Contents\n"
+    yield "\n"
+    yield "This is an automated table of contents for the Grok CLI project.\n"
+    yield "\n"
+    yield "## Project Structure\n"
+    yield "\n"
     
-    # Web files
-    elif ext in ['.html', '.css', '.js']:
-        return f"Web asset - {ext[1:].upper()} file"
+    for dir_name in sorted(dirs):
+        yield "### Root Directory\n" if dir_name == "." else f"### {dir_name}/\n"
+        yield "\n"
+        for file in sorted(dirs[dir_name]):
+            yield f"- **{file.rpartition(os.sep)[2]}** - {describe_file(file)}\n"
+        yield "\n"
     
-    # Data files
-    elif ext in ['.csv', '.json', '.xml', '.sql']:
-        return f"Data file - {ext[1:].upper()} format"
+    # Count by type in a single pass
+    py_count = test_count = config_count = 0
+    for f in all_files:
+        if f.endswith('.py'):
+            py_count += 1
+            if 'test' in f.lower():
+                test_count += 1
+        elif f.endswith(CONFIG_EXTS):
+            config_count += 1
     
-    # Default
-    else:
-        return f"File - {name}"
+    # Add summary
+    yield "## Summary\n"
+    yield "\n"
+    yield f"Total files: {len(all_files)}\n"
+    yield f"Python files: {py_count}\n"
+    yield f"Test files: {test_count}\n"
+    yield f"Configuration files: {config_count}\n"
+    yield "\n"
+    yield "Generated automatically by the Grok CLI project.\n"
 
 def create_tableofcontents():
     """Create a comprehensive table of contents for the project."""
@@ -110,61 +325,25 @@ def create_tableofcontents():
     all_files = list_files_recursive()
     print(f"Found {len(all_files)} files")
     
-    # Create table of contents content
-    content = []
-    content.append("# Grok CLI - Project Table of Contents")
-    content.append("")
-    content.append("This is an automated table of contents for the Grok CLI project.")
-    content.append("")
-    content.append("## Project Structure")
-    content.append("")
-    
-    # Group files by directory
-    dirs = {}
-    for file in sorted(all_files):
-        dir_name = os.path.dirname(file) if os.path.dirname(file) else "."
-        if dir_name not in dirs:
-            dirs[dir_name] = []
-        dirs[dir_name].append(file)
-    
-    # Generate content
-    for dir_name in sorted(dirs.keys()):
-        if dir_name == ".":
-            content.append("### Root Directory")
-        else:
-            content.append(f"### {dir_name}/")
-        content.append("")
-        
-        for file in sorted(dirs[dir_name]):
-            description = describe_file(file)
-            content.append(f"- **{os.path.basename(file)}** - {description}")
-        content.append("")
-    
-    # Add summary
-    content.append("## Summary")
-    content.append("")
-    content.append(f"Total files: {len(all_files)}")
-    
-    # Count by type
-    py_files = [f for f in all_files if f.endswith('.py')]
-    test_files = [f for f in py_files if 'test' in f.lower()]
-    config_files = [f for f in all_files if any(f.endswith(ext) for ext in ['.json', '.yaml', '.yml', '.toml', '.ini'])]
-    
-    content.append(f"Python files: {len(py_files)}")
-    content.append(f"Test files: {len(test_files)}")
-    content.append(f"Configuration files: {len(config_files)}")
-    content.append("")
-    content.append("Generated automatically by the Grok CLI project.")
+    # Group files by directory in one pass; only the buckets get sorted
+    dirs = defaultdict(list)
+    for file in all_files:
+        dirs[file.rpartition(os.sep)[0] or "."].append(file)
     
-    # Write to file
-    with open("tableofcontents.md", "w") as f:
-        f.write("\n".join(content))
+    # Stream the generated lines through the buffered writer; only the
+    # first lines (plus one to know whether there are more) are kept for
+    # the preview
+    lines = _toc_lines(dirs, all_files)
+    with open("tableofcontents.md", "w", buffering=1 << 16) as f:
+        head = list(islice(lines, 21))
+        f.writelines(head)
+        f.writelines(lines)
     
     print("✅ Table of contents created successfully!")
     print("\nContent preview:")
     print("-" * 50)
-    print("\n".join(content[:20]))
-    if len(content) > 20:
+    print("".join(head[:20]), end="")
+    if len(head) > 20:
         print("...")
     print("-" * 50)
 
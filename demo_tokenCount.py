@@ -2,7 +2,7 @@
 Demonstration of TokenCounter functionality for Grok CLI.
 """
 
-from grok_cli.tokenCount import TokenCounter, estimate_prompt_cost
+from grok_cli.tokenCount import TokenCounter, GrokPricing, token_cache_info
 
 
 def demo_basic_usage():
@@ -22,8 +22,8 @@ def demo_basic_usage():
     ]
     
     print("\n1. Token Counting Examples:")
-    for i, prompt in enumerate(prompts, 1):
-        tokens = counter.count_tokens(prompt)
+    token_counts = counter.count_tokens_batch(prompts)
+    for i, (prompt, tokens) in enumerate(zip(prompts, token_counts), 1):
         print(f"   Prompt {i}: {tokens} tokens")
         print(f"   Text: '{prompt[:50]}{'...' if len(prompt) > 50 else ''}'")
         print()
@@ -57,6 +57,7 @@ def demo_session_tracking():
         {"input": 500, "output": 1200, "model": "grok-4", "searches": 2, "op": "research_task"},
     ]
     
+    lines = []
     for i, call in enumerate(calls, 1):
         usage = counter.track_api_call(
             input_tokens=call["input"],
@@ -66,7 +67,8 @@ def demo_session_tracking():
             live_searches=call.get("searches", 0),
             operation_type=call["op"]
         )
-        print(f"   Call {i} ({call['op']}): ${counter.session_costs.total_cost:.4f} total")
+        lines.append(f"   Call {i} ({call['op']}): ${counter.session_costs.total_cost:.4f} total")
+    print("\n".join(lines))
     
     print("\n2. Session Summary:")
     counter.display_session_costs()
@@ -87,12 +89,21 @@ def demo_model_comparison():
     print(f"Prompt: '{test_prompt}'")
     print(f"Expected output: {expected_output} tokens\n")
     
+    # The tokenizer is shared by all models, so count the prompt once and
+    # price it for every model in one pass
+    counter = TokenCounter("demo_session.json")
+    input_tokens = counter.count_tokens(test_prompt)
+    costs = GrokPricing.estimate_costs_all_models(input_tokens, expected_output)
+    
+    # Build the whole table and write it once instead of four prints per model
+    lines = []
     for model in models:
-        estimate = estimate_prompt_cost(test_prompt, model)
-        print(f"{model:<15}: ${estimate['total_estimated_cost']:.4f}")
-        print(f"{'':15}  Input: {estimate['input_tokens']} tokens (${estimate['input_cost']:.4f})")
-        print(f"{'':15}  Output: {estimate['estimated_output_tokens']} tokens (${estimate['output_cost']:.4f})")
-        print()
+        estimate = costs[model]
+        lines.append(f"{model:<15}: ${estimate['total_cost']:.4f}")
+        lines.append(f"{'':15}  Input: {input_tokens} tokens (${estimate['input_cost']:.4f})")
+        lines.append(f"{'':15}  Output: {expected_output} tokens (${estimate['output_cost']:.4f})")
+        lines.append("")
+    print("\n".join(lines))
 
 
 def demo_leader_follower_costs():
@@ -133,6 +144,7 @@ def demo_leader_follower_costs():
     ]
     
     print(f"\n2. Follower Phase (grok-4-0709):")
+    lines = []
     for call in follower_calls:
         counter.track_api_call(
             input_tokens=call["input"],
@@ -140,7 +152,8 @@ def demo_leader_follower_costs():
             model="grok-4-0709",
             operation_type=call["op"]
         )
-        print(f"   {call['op']}: ${counter.session_costs.total_cost:.4f} total")
+        lines.append(f"   {call['op']}: ${counter.session_costs.total_cost:.4f} total")
+    print("\n".join(lines))
     
     print(f"\n3. Complete Workflow Summary:")
     counter.display_session_costs()
@@ -171,6 +184,9 @@ def run_all_demos():
     
     demo_leader_follower_costs()
     
+    cache = token_cache_info()
+    print(f"\nToken count cache: {cache.hits} hits, {cache.misses} misses")
+    
     print("\n" + "=" * 60)
     print("Demo Complete! TokenCounter is ready for integration.")
     print("=" * 60)
@@ -5,12 +5,24 @@ Returns the results in JSON format.
 """
 
 import requests
+import hashlib
 import json
 import os
 import sys
+import time
 from typing import Dict, List, Optional
+from functools import lru_cache
 from pathlib import Path
 
+from grok_cli._http import SESSION
+
+# orjson is optional and only used to format the output faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Try to import python-dotenv for .env file support
 try:
     from dotenv import load_dotenv
@@ -18,33 +30,78 @@ try:
 except ImportError:
     DOTENV_AVAILABLE = False
 
+# Look for .env file in the project root (parent directory of scripts)
+ENV_PATH = Path(__file__).parent.parent / '.env'
+
+@lru_cache(maxsize=1)
 def load_environment():
     """
     Load environment variables from .env file if available.
+    
+    Runs at most once per process, and does nothing when an API key is
+    already in the environment (CI, containers), since .env is only
+    consulted for the key.
     """
+    if os.getenv("XAI_API_KEY") or os.getenv("X_API_KEY"):
+        return
     if DOTENV_AVAILABLE:
-        # Look for .env file in the project root (parent directory of scripts)
-        env_path = Path(__file__).parent.parent / '.env'
-        if env_path.exists():
-            load_dotenv(env_path)
-            print(f"📁 Loaded environment from {env_path}", file=sys.stderr)
+        if ENV_PATH.exists():
+            load_dotenv(ENV_PATH)
+            print(f"📁 Loaded environment from {ENV_PATH}", file=sys.stderr)
         else:
             print("⚠️  .env file not found, using system environment variables", file=sys.stderr)
     else:
         print("⚠️  python-dotenv not installed, using system environment variables", file=sys.stderr)
         print("   Install with: pip install python-dotenv", file=sys.stderr)
 
-def get_xai_models(api_key: str, base_url: str = "https://api.x.ai/v1") -> Optional[Dict]:
+# The model list changes rarely, so responses are cached on disk per base URL
+MODELS_CACHE_DIR = Path("~/.cache/grok-cli").expanduser()
+MODELS_CACHE_TTL = 6 * 60 * 60  # seconds
+
+def _models_cache_path(base_url: str) -> Path:
+    """Return the cache file used for a given API base URL."""
+    digest = hashlib.sha256(base_url.encode("utf-8")).hexdigest()[:12]
+    return MODELS_CACHE_DIR / f"models_{digest}.json"
+
+def _read_models_cache(cache_path: Path) -> Optional[Dict]:
+    """Return cached model data if the cache file is younger than the TTL."""
+    try:
+        if time.time() - cache_path.stat().st_mtime < MODELS_CACHE_TTL:
+            return json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _write_models_cache(cache_path: Path, content: bytes) -> None:
+    """Atomically store a raw models response; failures are not fatal."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"⚠️  Could not write models cache {cache_path}: {e}", file=sys.stderr)
+
+def get_xai_models(api_key: str, base_url: str = "https://api.x.ai/v1", use_cache: bool = True) -> Optional[Dict]:
     """
     Connect to x.ai API and fetch all available models.
     
     Args:
         api_key: The x.ai API key
         base_url: The base URL for the x.ai API
+        use_cache: Return a cached response younger than MODELS_CACHE_TTL
+            instead of calling the API
         
     Returns:
         Dictionary containing the API response with model data, or None if error
     """
+    cache_path = _models_cache_path(base_url)
+    if use_cache:
+        cached = _read_models_cache(cache_path)
+        if cached is not None:
+            print(f"📦 Using cached models from {cache_path}", file=sys.stderr)
+            return cached
+    
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json"
@@ -52,10 +109,12 @@ def get_xai_models(api_key: str, base_url: str = "https://api.x.ai/v1") -> Optio
     
     try:
         # Make request to the models endpoint
-        response = requests.get(f"{base_url}/models", headers=headers, timeout=30)
+        response = SESSION.get(f"{base_url}/models", headers=headers, timeout=30)
         response.raise_for_status()
         
-        return response.json()
+        models_data = response.json()
+        _write_models_cache(cache_path, response.content)
+        return models_data
         
     except requests.exceptions.RequestException as e:
         print(f"Error making request to x.ai API: {e}", file=sys.stderr)
@@ -74,6 +133,8 @@ def format_models_output(models_data: Dict) -> str:
     Returns:
         Formatted JSON string
     """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(models_data, option=orjson.OPT_INDENT_2).decode("utf-8")
     return json.dumps(models_data, indent=2, ensure_ascii=False)
 
 def main():
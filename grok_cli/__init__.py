@@ -14,7 +14,23 @@ __author__ = "Grok CLI Team"
 __email__ = "oss@scratchpost.ai"
 __license__ = "GPL-3.0"
 
-from .cli import main
-from .engine import GrokEngine
-
 __all__ = ["main", "GrokEngine", "__version__"]
+
+
+def __getattr__(name):
+    """Import ``main`` and ``GrokEngine`` on first access (PEP 562).
+
+    Keeps ``import grok_cli`` and ``grok_cli.__version__`` from loading the
+    engine and its requests/tiktoken dependency chain.
+    """
+    if name == "main":
+        from .cli import main
+        return main
+    if name == "GrokEngine":
+        from .engine import GrokEngine
+        return GrokEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,37 @@
+"""
+Shared HTTP session for Grok CLI network calls
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import __version__
+
+USER_AGENT = f"grok-cli/{__version__}"
+
+
+def create_session(pool_connections: int = 4, pool_maxsize: int = 8, retries: int = 3) -> requests.Session:
+    """Create a requests session with a pooled, retrying adapter for http and https.
+
+    Retry keeps urllib3's default method list, so connection failures are
+    retried for every request but 429/5xx responses only for idempotent
+    ones like GET. Chat completion POSTs handle 429 themselves.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# One pooled session per process so every caller reuses keep-alive
+# connections instead of repeating the TCP and TLS handshake
+SESSION = create_session()
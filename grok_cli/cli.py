@@ -3,16 +3,44 @@ Clean CLI entry point for Grok CLI
 """
 
 import argparse
-import json
 import os
 import random
 import sys
+from typing import TYPE_CHECKING
 
-from .engine import GrokEngine, DEFAULT_MODEL
-from .utils import get_api_key, build_vision_content, get_random_message
-from .leader import LeaderFollowerOrchestrator
+from .utils import get_api_key, build_vision_content, get_random_message, json_dumps_bytes
 
-def single_prompt(args, engine: GrokEngine):
+# The engine pulls in requests, tiktoken and the tool stack; it is imported
+# only once argument parsing has succeeded so --help and bad argv stay fast
+if TYPE_CHECKING:
+    from .engine import GrokEngine
+
+# Interactive chat resends the whole history every turn; beyond this many
+# messages the oldest turns are dropped (the system message is always kept)
+MAX_HISTORY_MESSAGES = 40
+
+def trim_history(history, max_messages=MAX_HISTORY_MESSAGES):
+    """Drop the oldest turns in place so history stays within max_messages.
+    
+    The kept window starts at a user message, so tool results are never
+    separated from the assistant message that requested them. The current
+    turn is always kept whole; if it alone exceeds the limit, every earlier
+    turn is dropped. Returns the number of messages dropped.
+    """
+    if len(history) <= max_messages:
+        return 0
+    cutoff = len(history) - (max_messages - 1)
+    while cutoff < len(history) and history[cutoff].get("role") != "user":
+        cutoff += 1
+    if cutoff >= len(history):
+        # No user message in the window: cut at the start of the current turn
+        cutoff = len(history) - 1
+        while cutoff > 1 and history[cutoff].get("role") != "user":
+            cutoff -= 1
+    del history[1:cutoff]
+    return cutoff - 1
+
+def single_prompt(args, engine: "GrokEngine"):
     """Handle single prompt mode."""
     engine.display_startup_message()
     
@@ -24,7 +52,7 @@ def single_prompt(args, engine: GrokEngine):
     content = build_vision_content(args.prompt, args.image)
     
     messages = [
-        {"role": "system", "content": engine.get_enhanced_system_prompt()},
+        engine.get_system_message(),
         {"role": "user", "content": content}
     ]
     
@@ -38,7 +66,7 @@ def single_prompt(args, engine: GrokEngine):
     if args.cost:
         engine.display_session_summary()
 
-def interactive_chat(args, engine: GrokEngine):
+def interactive_chat(args, engine: "GrokEngine"):
     """Handle interactive chat mode."""
     print(f"\n{get_random_message('startup')}\n")
     
@@ -48,7 +76,10 @@ def interactive_chat(args, engine: GrokEngine):
     
     key, brave_key = get_api_key(args)
     
-    history = [{"role": "system", "content": engine.get_enhanced_system_prompt()}]
+    # The system prompt only depends on the source directory, so the message
+    # is built once and reused by /clear; nothing mutates it
+    system_msg = engine.get_system_message()
+    history = [system_msg]
     print("Interactive chat started. Type /quit to exit, /clear to reset history, /save <file> to save.")
     if args.cost:
         print("Cost tracking enabled. Type /costs to see session summary.")
@@ -63,7 +94,7 @@ def interactive_chat(args, engine: GrokEngine):
         if user_input == "/quit":
             break
         elif user_input == "/clear":
-            history = [{"role": "system", "content": engine.get_enhanced_system_prompt()}]
+            history = [system_msg]
             print("History cleared.")
             continue
         elif user_input == "/costs":
@@ -73,10 +104,11 @@ def interactive_chat(args, engine: GrokEngine):
                 print("Cost tracking is not enabled. Use --cost flag to enable.")
             continue
         elif user_input.startswith("/save "):
-            filename = user_input.split(" ", 1)[1]
+            filename = user_input[6:]
             try:
-                with open(filename, "w", encoding="utf-8") as f:
-                    json.dump(history, f, indent=2)
+                # Serialize in one call and write the bytes once
+                with open(filename, "wb") as f:
+                    f.write(json_dumps_bytes(history, pretty=True))
                 print(f"History saved to {filename}.")
             except Exception as e:
                 print(f"Error saving history: {e}")
@@ -86,13 +118,17 @@ def interactive_chat(args, engine: GrokEngine):
         history.append({"role": "user", "content": content})
         
         engine.run_chat_loop(args, key, brave_key, history)
+        
+        dropped = trim_history(history)
+        if dropped:
+            print(f">> Dropped {dropped} older messages to keep the conversation within {MAX_HISTORY_MESSAGES} messages.")
     
     # Display final session summary if cost tracking enabled
     if args.cost:
         print("\nFinal Session Summary:")
         engine.display_session_summary()
 
-def leader_mode(args, engine: GrokEngine):
+def leader_mode(args, engine: "GrokEngine"):
     """Handle leader-follower mode with strategic planning."""
     print(f"\n🎯 Leader Mode Activated: Strategic Planning & Execution")
     print("Leader (grok-3-mini) will create a strategic plan")
@@ -111,6 +147,8 @@ def leader_mode(args, engine: GrokEngine):
     else:
         objective = args.prompt
     
+    # Imported here so prompt and chat runs don't load the leader module
+    from .leader import LeaderFollowerOrchestrator
     orchestrator = LeaderFollowerOrchestrator(engine, args.src)
     orchestrator.execute_leader_follower_workflow(objective, args)
     
@@ -127,6 +165,7 @@ def test_mode():
     assert build_vision_content("test", None) == [{"type": "text", "text": "test"}]
     
     # Test engine initialization
+    from .engine import GrokEngine
     engine = GrokEngine()
     assert engine.config is not None
     assert engine.tools is not None
@@ -135,15 +174,13 @@ def test_mode():
 
 def main():
     """Main entry point for the CLI."""
-    engine = GrokEngine()
-    
     parser = argparse.ArgumentParser(
         description="Grok CLI: Interact with xAI Grok API. Get key at https://x.ai/api."
     )
     parser.add_argument("--prompt", help="Single prompt to send.")
     parser.add_argument("--chat", action="store_true", help="Start interactive chat.")
-    parser.add_argument("--model", default=engine.config.get("model", DEFAULT_MODEL), help="Model to use.")
-    parser.add_argument("--stream", action="store_true", default=engine.config.get("stream", False), help="Stream response.")
+    parser.add_argument("--model", help="Model to use.")
+    parser.add_argument("--stream", action="store_true", help="Stream response.")
     parser.add_argument("--api-key", help="API key (prefer env var XAI_API_KEY for security).")
     parser.add_argument("--image", help="Image URL or local path for vision.")
     parser.add_argument("--debug", type=int, choices=[0, 1], help="Debug mode: 1=on, 0=off (overrides GROK_DEBUG env var).")
@@ -163,14 +200,23 @@ def main():
     if not os.path.isdir(args.src):
         print(f"Error: Source directory '{args.src}' does not exist.")
         sys.exit(1)
-    
-    # Set the working directory boundary
-    engine.set_source_directory(args.src)
 
     if not args.prompt and not args.chat and not args.lead:
         parser.print_help()
         sys.exit(1)
 
+    # Only a run that will talk to the API loads the engine and settings.json
+    from .engine import GrokEngine, DEFAULT_MODEL
+    engine = GrokEngine()
+    # settings.json supplies the defaults for options left off the command line
+    if args.model is None:
+        args.model = engine.config.get("model", DEFAULT_MODEL)
+    if not args.stream:
+        args.stream = engine.config.get("stream", False)
+    
+    # Set the working directory boundary
+    engine.set_source_directory(args.src)
+
     if args.lead:
         leader_mode(args, engine)
     elif args.prompt:
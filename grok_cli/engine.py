@@ -2,14 +2,21 @@
 Core engine for Grok CLI with advanced optimization and streaming
 """
 
-import asyncio
+import fnmatch
 import json
 import os
 import random
+import re
+import stat
 import sys
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Tuple
+from email.utils import parsedate_tz, mktime_tz
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import requests
 
 try:
@@ -19,19 +26,56 @@ try:
 except ImportError:
     XAI_SDK_AVAILABLE = False
 
-from .request_manager import RequestManager, RequestPriority
-from .utils import get_random_message, load_grok_context, create_grok_directory_template
+# msgspec is optional; it decodes stream chunks straight into typed structs
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+from ._http import SESSION as _SESSION
+from .request_manager import RequestManager, RequestPriority, TokenBucket
+from .utils import get_random_message, load_grok_context, create_grok_directory_template, json_dumps, json_dumps_bytes, json_loads, load_json_cached
 from .tokenCount import TokenCounter
 from .tool_output_capture import ToolOutputCapture, EnhancedToolExecutor
 from .memory_manager import MemoryManager
 
 # xAI API endpoint - using v1 path (OpenAI compatible)
 API_URL = "https://api.x.ai/v1/chat/completions"
+BRAVE_SEARCH_URL = "https://api.search.brave.com/res/v1/web/search"
+# Upper bound on threads used to read files in parallel for batch_read_files
+BATCH_READ_WORKERS = 16
+# rm -r trees with at least this many entries are unlinked from a thread pool
+RMTREE_PARALLEL_MIN_ENTRIES = 256
+RMTREE_BATCH = 64
+# Streamed tokens written between stdout flushes (a newline always flushes)
+STREAM_FLUSH_EVERY = 16
+# Largest slice read_file returns in one call; bigger files come back truncated
+MAX_READ_BYTES = 8 * 1024 * 1024
+# Read-only tools whose concurrent identical calls share one execution
+COALESCED_TOOLS = frozenset({"read_file", "batch_read_files", "list_files_recursive", "brave_search"})
+# Upper bound on threads used to run consecutive read-only tool calls together
+TOOL_CALL_WORKERS = 8
+# Repeat Brave queries within this many seconds are answered from memory;
+# set GROK_NO_SEARCH_CACHE=1 to always hit the API
+BRAVE_CACHE_TTL = 300
+BRAVE_CACHE_SIZE = 256
+# Token-bucket limits: sustained requests per second and burst size
+API_RATE_LIMIT = (1.0, 3)
+BRAVE_RATE_LIMIT = (1.0, 1)  # Brave's free plan allows 1 query per second
 DEFAULT_MODEL = "grok-4-0709"
 REASONING_MODELS = {
     "grok-4-0709": "grok-4-0709-reasoning",
     "grok-3-mini": "grok-3-mini-reasoning"
 }
+# Shown while waiting out a rate limit
+_FUN_MESSAGES = (
+    ">> Optimizing request for best results...",
+    ">> Launching your perfectly timed query...",
+    ">> Grok is ready and waiting...",
+    ">> Request dispatched with optimal timing...",
+    ">> The optimized show begins...",
+)
 SYSTEM_PROMPT = """You are Grok, a helpful and truthful AI built by xAI. You have FULL ACCESS to the local filesystem and can perform any file operations needed.
 
  AVAILABLE TOOLS - YOU CAN USE THESE:
@@ -75,6 +119,378 @@ Tool Usage:
 - File operations are cached to avoid redundant reads
 - Multiple tool calls are automatically optimized"""
 
+# Deterministic part of the 429 backoff per attempt (5s doubling, capped at
+# 60s); jitter is added when the wait is computed
+_BACKOFF_BASE = tuple(min(5 * (2 ** (attempt - 1)), 60) for attempt in range(1, 11))
+_BACKOFF_CAP = 60
+
+PROGRESS_BAR_WIDTH = 30
+_BARS = tuple("#" * i + "-" * (PROGRESS_BAR_WIDTH - i) for i in range(PROGRESS_BAR_WIDTH + 1))
+
+
+def _draw_progress_bar(wait_time: float, start: float, done: threading.Event) -> None:
+    """Redraw the countdown bar until done is set or wait_time elapses."""
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    interval = max(0.25, wait_time / 40)
+    deadline = start + wait_time
+    while True:
+        now = time.monotonic()
+        remaining = deadline - now
+        if remaining <= 0:
+            break
+        progress = int((now - start) / wait_time * PROGRESS_BAR_WIDTH)
+        bar = _BARS[min(progress, PROGRESS_BAR_WIDTH)]
+        write(f"\x1b[2K\r[{bar}] {remaining:.1f}s remaining")
+        flush()
+        if done.wait(min(interval, remaining)):
+            break
+    write("\x1b[2K\r")
+    flush()
+
+
+def show_progress_bar(wait_time: float) -> None:
+    """Sleep for wait_time seconds, drawing a countdown bar on a terminal.
+
+    The caller always does one sleep; on a terminal a daemon thread redraws
+    the bar at most ~40 times (never more often than every 0.25s) and each
+    redraw clears the line with an ANSI erase instead of padding.
+    """
+    if wait_time <= 0:
+        return
+    if not sys.stdout.isatty():
+        time.sleep(wait_time)
+        return
+    
+    done = threading.Event()
+    drawer = threading.Thread(
+        target=_draw_progress_bar, args=(wait_time, time.monotonic(), done), daemon=True
+    )
+    drawer.start()
+    try:
+        time.sleep(wait_time)
+    finally:
+        done.set()
+        drawer.join()
+
+
+@lru_cache(maxsize=8)
+def _compile_ignore_patterns(patterns: Tuple[str, ...]) -> Callable[[str], bool]:
+    """Build an is_ignored(path, name=None) predicate for a set of .gitignore lines.
+    
+    Matches exactly like checking each pattern in turn: 'dir/' patterns hit
+    at the start of the path or after a '/', other patterns hit anywhere as
+    a substring, and patterns with '*' also match as fnmatch globs against
+    the whole path or its basename. The pattern list is split by kind once,
+    and all globs are compiled into a single regex, so a path costs one
+    startswith, a few substring tests and at most two regex matches.
+    Callers that already know the basename (e.g. a DirEntry's name) can
+    pass it as name to skip recomputing it.
+    """
+    dir_patterns = tuple(p for p in patterns if p.endswith('/'))
+    nested_dirs = tuple('/' + p for p in dir_patterns)
+    substrings = tuple(p for p in patterns if not p.endswith('/'))
+    globs = [fnmatch.translate(os.path.normcase(p)) for p in substrings if '*' in p]
+    glob_match = re.compile('|'.join(globs)).match if globs else None
+    normcase = os.path.normcase
+    basename = os.path.basename
+    # normcase is the identity on POSIX; only pay for it where it folds
+    fold_case = normcase('A/') != 'A/'
+    
+    def is_ignored(path: str, name: Optional[str] = None) -> bool:
+        if path.startswith(dir_patterns):
+            return True
+        for pattern in nested_dirs:
+            if pattern in path:
+                return True
+        for pattern in substrings:
+            if pattern in path:
+                return True
+        if glob_match is not None:
+            if name is None:
+                name = basename(path)
+            if fold_case:
+                path, name = normcase(path), normcase(name)
+            return bool(glob_match(path) or glob_match(name))
+        return False
+    
+    return is_ignored
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _truncate_to_complete_json(text: str) -> str:
+    """Cut text down to its first complete JSON object.
+    
+    Used to salvage streamed tool arguments that arrive with trailing
+    garbage or a second, unfinished object. Braces inside string literals
+    are ignored. Returns text unchanged when no complete object is found.
+    """
+    stripped = text.strip()
+    try:
+        _, end = _JSON_DECODER.raw_decode(stripped)
+        return stripped[:end]
+    except ValueError:
+        pass
+    
+    # Not valid JSON up to the first object either; fall back to a
+    # string-aware brace scan so at least the object boundary is right
+    depth = 0
+    in_string = escape = False
+    for i, char in enumerate(stripped):
+        if in_string:
+            if escape:
+                escape = False
+            elif char == '\\':
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                return stripped[:i + 1]
+    return text
+
+
+def _encode_text(text: str) -> bytes:
+    """Encode text for writing to disk the way text-mode open() would."""
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8")
+
+
+def _to_crlf(data: bytes) -> bytes:
+    """Convert every line ending in data to CRLF."""
+    return data.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n")
+
+
+def _write_bytes(path: str, data: bytes):
+    """Create or truncate path and write data with unbuffered os.write calls."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _unlink_batch(paths: List[str]) -> Optional[OSError]:
+    """Unlink each path, returning the first error instead of raising it."""
+    error = None
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError as e:
+            error = error or e
+    return error
+
+
+def _parallel_rmtree(root: str):
+    """Remove a directory tree, unlinking files from a thread pool when it is large.
+    
+    The tree is scanned once. Below RMTREE_PARALLEL_MIN_ENTRIES entries, or
+    on a single CPU where the threads only contend, it is handed to
+    shutil.rmtree; otherwise files and symlinks are unlinked in batches
+    across threads (unlink releases the GIL) and the directories are
+    removed deepest first. Raises the first OSError, like shutil.rmtree.
+    """
+    cpus = os.cpu_count() or 1
+    files = []
+    dirs = [root]
+    i = 0
+    # Breadth-first, so every directory is listed after its parent
+    while i < len(dirs):
+        with os.scandir(dirs[i]) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                else:
+                    files.append(entry.path)
+        i += 1
+    
+    if cpus < 2 or len(files) + len(dirs) < RMTREE_PARALLEL_MIN_ENTRIES:
+        import shutil
+        shutil.rmtree(root)
+        return
+    
+    # A tree of only directories has nothing to unlink
+    if files:
+        from concurrent.futures import ThreadPoolExecutor
+        batches = [files[j:j + RMTREE_BATCH] for j in range(0, len(files), RMTREE_BATCH)]
+        workers = min(32, cpus * 4, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            errors = [e for e in pool.map(_unlink_batch, batches) if e is not None]
+        if errors:
+            raise errors[0]
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+
+
+def _read_only_runs(tool_calls: List[Dict[str, Any]]) -> Dict[int, int]:
+    """Map the start index of each run of 2+ consecutive read-only tool calls to its end.
+    
+    Only adjacent read-only calls are run together, so no call ever
+    overtakes a file write or shell command that was requested before it.
+    """
+    runs = {}
+    start = None
+    for i, tool_call in enumerate(tool_calls + [None]):
+        if tool_call is not None and tool_call['function']['name'] in COALESCED_TOOLS:
+            if start is None:
+                start = i
+            continue
+        if start is not None and i - start > 1:
+            runs[start] = i
+        start = None
+    return runs
+
+
+def _iter_sse_data(response, chunk_size: int = 8192):
+    """Yield the payload bytes of each 'data:' line in a server-sent event stream.
+    
+    Reads the body in large chunks and splits lines out of a byte buffer
+    rather than going through iter_lines, and strips the 'data:' field name
+    as a prefix. Blank lines, comments and other SSE fields are skipped.
+    """
+    buffer = b""
+    for raw in response.iter_content(chunk_size=chunk_size):
+        if not raw:
+            continue
+        buffer += raw
+        if b"\n" not in raw:
+            continue
+        lines = buffer.split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            if line.startswith(b"data:"):
+                yield line[5:].strip()
+    if buffer.startswith(b"data:"):
+        yield buffer[5:].strip()
+
+
+if MSGSPEC_AVAILABLE:
+    class _StreamDelta(msgspec.Struct):
+        content: Optional[str] = None
+        tool_calls: Optional[List[Dict[str, Any]]] = None
+    
+    class _StreamChoice(msgspec.Struct):
+        delta: Optional[_StreamDelta] = None
+    
+    class _StreamChunk(msgspec.Struct):
+        choices: List[_StreamChoice]
+    
+    _stream_chunk_decoder = msgspec.json.Decoder(_StreamChunk)
+    
+    def _decode_stream_delta(payload: bytes) -> Tuple[Optional[str], Optional[List[Dict[str, Any]]]]:
+        """Return (content, tool_call deltas) of one streamed chat chunk.
+        
+        Only the fields read here are decoded; ids, timestamps and the rest
+        of each chunk are skipped by the decoder instead of built into dicts.
+        """
+        delta = _stream_chunk_decoder.decode(payload).choices[0].delta
+        if delta is None:
+            return None, None
+        return delta.content, delta.tool_calls
+    
+    _STREAM_DECODE_ERRORS = (KeyError, IndexError, json.JSONDecodeError, msgspec.DecodeError)
+else:
+    def _decode_stream_delta(payload: bytes) -> Tuple[Optional[str], Optional[List[Dict[str, Any]]]]:
+        """Return (content, tool_call deltas) of one streamed chat chunk."""
+        delta = json_loads(payload)["choices"][0].get("delta")
+        if not delta:
+            return None, None
+        return delta.get("content"), delta.get("tool_calls")
+    
+    _STREAM_DECODE_ERRORS = (KeyError, IndexError, json.JSONDecodeError)
+
+
+class _SDKResponseWrapper:
+    """Give an xAI SDK chat response the attributes run_chat_loop expects of a requests response."""
+    
+    __slots__ = ("sdk_response", "content", "reasoning_content", "usage", "choices", "_reasoning")
+    
+    def __init__(self, sdk_response, reasoning: bool = False):
+        self.sdk_response = sdk_response
+        self.content = sdk_response.content
+        self.reasoning_content = getattr(sdk_response, 'reasoning_content', '') if reasoning else ''
+        self.usage = sdk_response.usage
+        self.choices = [SimpleNamespace(message=SimpleNamespace(content=self.content))]
+        self._reasoning = reasoning
+    
+    def json(self) -> Dict[str, Any]:
+        usage = {
+            "prompt_tokens": self.usage.prompt_tokens,
+            "completion_tokens": self.usage.completion_tokens,
+        }
+        if self._reasoning:
+            usage["reasoning_tokens"] = getattr(self.usage, 'reasoning_tokens', 0)
+        usage["prompt_tokens_details"] = {
+            "cached_tokens": getattr(self.usage, 'cached_prompt_text_tokens', 0)
+        }
+        usage["total_tokens"] = self.usage.prompt_tokens + self.usage.completion_tokens
+        return {"choices": [{"message": {"content": self.content}}], "usage": usage}
+
+
+class FileContentCache:
+    """Bounded LRU of decoded file contents, validated by mtime and size.
+    
+    Entries are keyed by absolute path and reused only while the file's
+    st_mtime_ns and st_size are unchanged, so edits made outside the tools
+    are picked up on the next read. Safe to use from several threads.
+    """
+    
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # abs path -> (mtime_ns, size, content)
+        self._bytes = 0
+        self._lock = threading.Lock()
+    
+    def read(self, filename: str, max_size: Optional[int] = None) -> Optional[str]:
+        """Return the UTF-8 text of filename, from the cache when still current.
+        
+        Returns None without reading anything if the file is over max_size bytes.
+        """
+        path = os.path.abspath(filename)
+        st = os.stat(path)
+        if max_size is not None and st.st_size > max_size:
+            return None
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                self._entries.move_to_end(path)
+                return entry[2]
+        
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        
+        if st.st_size <= self.max_bytes:
+            with self._lock:
+                self._discard(path)
+                self._entries[path] = (st.st_mtime_ns, st.st_size, content)
+                self._bytes += st.st_size
+                while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                    _, (_, size, _) = self._entries.popitem(last=False)
+                    self._bytes -= size
+        return content
+    
+    def invalidate(self, filename: str):
+        """Forget any cached content for filename (call after writing it)."""
+        with self._lock:
+            self._discard(os.path.abspath(filename))
+    
+    def _discard(self, path: str):
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+
 class EnhancedToolExecutor:
     """Enhanced tool executor with output capture support."""
     
@@ -121,28 +537,52 @@ class GrokEngine:
     
     def __init__(self, min_delay_seconds: float = 0.3):
         self.request_manager = RequestManager(min_delay_seconds)
+        self._api_bucket = TokenBucket(*API_RATE_LIMIT)
+        self._brave_bucket = TokenBucket(*BRAVE_RATE_LIMIT)
+        self._brave_cache = OrderedDict()  # normalized query -> (fetched_at, result)
+        self._brave_cache_lock = threading.Lock()
         self.config = self.load_config()
         self.tools = self.build_tool_definitions()
+        # Sent with every request; serialized once and spliced into the body
+        self._tools_json = json_dumps_bytes(self.tools)
         self.last_request_time = 0
         self.source_directory = None
+        self._source_real = None  # source_directory with symlinks resolved
         self.project_context = ""
+        self._system_message = None
+        self._system_message_json = b""
+        self._enhanced_prompt = None  # ((project_context, source_directory), prompt)
         self.token_counter = None
         self.cost_tracking_enabled = False
+        # Input token count from api_call's cost estimate, reused by the
+        # streaming branch of run_chat_loop for the same message list
+        self._last_input_tokens = None
         self.xai_client = None
         self.tool_output_capture = ToolOutputCapture()
         self.enhanced_executor = EnhancedToolExecutor(self)
+        # Tool arguments already parsed while validating the last stream,
+        # keyed by the raw JSON string so execute_tool_call can skip a re-parse
+        self._parsed_tool_args: Dict[str, Any] = {}
+        self._file_cache = FileContentCache()
+        self._gitignore_cache = None  # ((path, mtime_ns), patterns)
+        # (tool name, raw arguments) -> Future of the call currently running
+        self._inflight: Dict[Tuple[str, str], Any] = {}
+        self._inflight_lock = threading.Lock()
+        # Home directory for a bare cd; the working directory itself is
+        # process-wide and shared with other engines, so it is never cached
+        self._home = None
         
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from settings.json."""
-        config_path = "settings.json"
-        if os.path.exists(config_path):
-            with open(config_path, "r") as f:
-                return json.load(f)
-        return {}
+        config = load_json_cached("settings.json")
+        return {} if config is None else config
     
     def set_source_directory(self, src_path: str):
         """Set the source directory and load project context."""
         self.source_directory = os.path.abspath(src_path)
+        self._source_real = os.path.realpath(self.source_directory)
+        self._system_message = None
+        self._system_message_json = b""
         
         # Try to create .grok directory template if it doesn't exist
         created = create_grok_directory_template(self.source_directory)
@@ -157,7 +597,13 @@ class GrokEngine:
             print(f">> No project context found in .grok directory")
     
     def get_enhanced_system_prompt(self) -> str:
-        """Get system prompt enhanced with project context."""
+        """Get system prompt enhanced with project context, rebuilt only when either changes."""
+        key = (self.project_context, self.source_directory)
+        if self._enhanced_prompt is None or self._enhanced_prompt[0] != key:
+            self._enhanced_prompt = (key, self._build_enhanced_system_prompt())
+        return self._enhanced_prompt[1]
+    
+    def _build_enhanced_system_prompt(self) -> str:
         base_prompt = SYSTEM_PROMPT
         
         if self.project_context:
@@ -171,6 +617,26 @@ class GrokEngine:
         
         return base_prompt
     
+    def get_system_message(self) -> Dict[str, str]:
+        """System message that opens a conversation, built once per source directory.
+        
+        The same dict is returned to every caller, so treat it as read-only.
+        Its JSON encoding is kept alongside for _encode_messages.
+        """
+        if self._system_message is None:
+            self._system_message = {"role": "system", "content": self.get_enhanced_system_prompt()}
+            self._system_message_json = json_dumps_bytes(self._system_message)
+        return self._system_message
+    
+    def _encode_messages(self, messages: List[Dict[str, Any]]) -> bytes:
+        """JSON-encode messages, reusing the cached encoding of a leading system message."""
+        if messages and messages[0] is self._system_message:
+            rest = messages[1:]
+            if not rest:
+                return b"[" + self._system_message_json + b"]"
+            return b"[" + self._system_message_json + b"," + json_dumps_bytes(rest)[1:]
+        return json_dumps_bytes(messages)
+    
     def init_xai_client(self, api_key: str):
         """Initialize xAI SDK client."""
         if XAI_SDK_AVAILABLE:
@@ -192,11 +658,15 @@ class GrokEngine:
         
         usage = response_data.get("usage", {})
         if usage:
-            input_tokens = usage.get("prompt_tokens", 0)
+            prompt_tokens = usage.get("prompt_tokens", 0)
             output_tokens = usage.get("completion_tokens", 0)
             
-            # Grok API might provide cached tokens info
-            cached_tokens = usage.get("cached_tokens", 0)
+            # Prefix cache hits are reported OpenAI-style under
+            # prompt_tokens_details and are included in prompt_tokens, so
+            # split them out to bill them at the cached-input rate
+            details = usage.get("prompt_tokens_details") or {}
+            cached_tokens = details.get("cached_tokens") or usage.get("cached_tokens") or 0
+            input_tokens = max(0, prompt_tokens - cached_tokens)
             
             self.token_counter.track_api_call(
                 input_tokens=input_tokens,
@@ -222,11 +692,24 @@ class GrokEngine:
     
     def build_tool_definitions(self) -> List[Dict[str, Any]]:
         """Build tool definitions for enabled MCP servers."""
-        tools = []
         mcp_servers = self.config.get("mcp_servers", {})
+        return list(self._tool_definitions(
+            bool(mcp_servers.get("brave_search", {}).get("enabled", False)),
+            bool(mcp_servers.get("local_file_system", {}).get("enabled", False)),
+        ))
+    
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _tool_definitions(brave_search_enabled: bool, local_file_system_enabled: bool) -> Tuple[Dict[str, Any], ...]:
+        """Tool schemas for a combination of enabled servers, built once.
+        
+        The dicts are shared between engines; callers get a fresh list but
+        must not modify the schemas themselves.
+        """
+        tools = []
         
         # Brave Search tool
-        if mcp_servers.get("brave_search", {}).get("enabled", False):
+        if brave_search_enabled:
             tools.append({
                 "type": "function",
                 "function": {
@@ -246,7 +729,7 @@ class GrokEngine:
             })
         
         # Optimized Local File System tools
-        if mcp_servers.get("local_file_system", {}).get("enabled", False):
+        if local_file_system_enabled:
             tools.extend([
                 {
                     "type": "function",
@@ -259,6 +742,14 @@ class GrokEngine:
                                 "filename": {
                                     "type": "string",
                                     "description": "The name of the file to read (relative or absolute path)"
+                                },
+                                "offset": {
+                                    "type": "integer",
+                                    "description": "Optional byte offset to start reading from (default 0)"
+                                },
+                                "length": {
+                                    "type": "integer",
+                                    "description": "Optional maximum number of bytes to read; omit to read to the end"
                                 }
                             },
                             "required": ["filename"]
@@ -381,7 +872,7 @@ class GrokEngine:
             }
         })
         
-        return tools
+        return tuple(tools)
     
     def handle_stream_with_tools(self, response, brave_api_key=None, debug_mode=None, capture_tools=False) -> Tuple[str, List[Dict], Optional[str]]:
         """Handle streaming response with tool call detection."""
@@ -391,67 +882,69 @@ class GrokEngine:
         
         is_debug = debug_mode if debug_mode is not None else bool(os.getenv("GROK_DEBUG"))
         
-        for chunk in response.iter_lines():
-            if chunk:
-                chunk = chunk.decode("utf-8").lstrip("data: ")
-                if chunk != "[DONE]":
-                    try:
-                        data = json.loads(chunk)
-                        choice = data["choices"][0]
-                        
-                        if "delta" in choice and "content" in choice["delta"]:
-                            delta = choice["delta"]["content"]
-                            print(delta, end="", flush=True)
-                            full_content.append(delta)
-                        
-                        if "delta" in choice and "tool_calls" in choice["delta"]:
-                            for tool_call_delta in choice["delta"]["tool_calls"]:
-                                if "index" in tool_call_delta:
-                                    idx = tool_call_delta["index"]
-                                    while len(tool_calls) <= idx:
-                                        tool_calls.append({
-                                            "id": "",
-                                            "type": "function",
-                                            "function": {"name": "", "arguments": ""}
-                                        })
-                                    
-                                    if "id" in tool_call_delta:
-                                        tool_calls[idx]["id"] = tool_call_delta["id"]
-                                    if "function" in tool_call_delta:
-                                        if "name" in tool_call_delta["function"]:
-                                            tool_calls[idx]["function"]["name"] = tool_call_delta["function"]["name"]
-                                        if "arguments" in tool_call_delta["function"]:
-                                            tool_calls[idx]["function"]["arguments"] += tool_call_delta["function"]["arguments"]
-                        
-                    except (KeyError, json.JSONDecodeError) as e:
-                        if is_debug:
-                            print(f"\n[DEBUG] Error parsing chunk: {e}")
-                            print(f"[DEBUG] Raw chunk: {repr(chunk)}")
+        # Hot loop: runs once per streamed token, so bind lookups locally
+        decode = _decode_stream_delta
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        append = full_content.append
+        unflushed = 0
+        
+        for chunk in _iter_sse_data(response):
+            if not chunk or chunk == b"[DONE]":
+                continue
+            try:
+                text, tool_call_deltas = decode(chunk)
+                if text:
+                    write(text)
+                    append(text)
+                    # Flush per line or every few tokens instead of every token
+                    unflushed += 1
+                    if unflushed >= STREAM_FLUSH_EVERY or "\n" in text:
+                        flush()
+                        unflushed = 0
+                
+                if tool_call_deltas:
+                    for tool_call_delta in tool_call_deltas:
+                        if "index" in tool_call_delta:
+                            idx = tool_call_delta["index"]
+                            while len(tool_calls) <= idx:
+                                tool_calls.append({
+                                    "id": "",
+                                    "type": "function",
+                                    "function": {"name": "", "arguments": ""}
+                                })
+                            
+                            if "id" in tool_call_delta:
+                                tool_calls[idx]["id"] = tool_call_delta["id"]
+                            function = tool_call_delta.get("function")
+                            if function:
+                                if "name" in function:
+                                    tool_calls[idx]["function"]["name"] = function["name"]
+                                if "arguments" in function:
+                                    tool_calls[idx]["function"]["arguments"] += function["arguments"]
+                
+            except _STREAM_DECODE_ERRORS as e:
+                if is_debug:
+                    print(f"\n[DEBUG] Error parsing chunk: {e}")
+                    print(f"[DEBUG] Raw chunk: {repr(chunk)}")
+        flush()
         
         # Validate and fix tool call arguments
+        self._parsed_tool_args = parsed_args = {}
         for i, tool_call in enumerate(tool_calls):
             if tool_call["function"]["arguments"]:
                 try:
-                    json.loads(tool_call["function"]["arguments"])
+                    arguments = tool_call["function"]["arguments"]
+                    parsed_args[arguments] = json_loads(arguments)
                 except json.JSONDecodeError as e:
                     print(f"\n[WARNING] Tool call {i} has invalid JSON arguments")
                     if os.getenv("GROK_DEBUG"):
                         print(f"[DEBUG] Raw arguments: {repr(tool_call['function']['arguments'])}")
-                    args = tool_call["function"]["arguments"]
-                    if args.count('{') > args.count('}'):
-                        depth = 0
-                        last_complete = -1
-                        for j, char in enumerate(args):
-                            if char == '{':
-                                depth += 1
-                            elif char == '}':
-                                depth -= 1
-                                if depth == 0:
-                                    last_complete = j
-                        if last_complete > 0:
-                            tool_call["function"]["arguments"] = args[:last_complete + 1]
-                            if os.getenv("GROK_DEBUG"):
-                                print(f"[DEBUG] Fixed arguments: {tool_call['function']['arguments']}")
+                    fixed = _truncate_to_complete_json(arguments)
+                    if fixed != arguments:
+                        tool_call["function"]["arguments"] = fixed
+                        if os.getenv("GROK_DEBUG"):
+                            print(f"[DEBUG] Fixed arguments: {fixed}")
         
         print()  # New line after streaming
         return "".join(full_content), tool_calls, None  # No tool outputs yet
@@ -465,10 +958,13 @@ class GrokEngine:
         if not args_str or args_str.strip() == '':
             args = {}
         else:
-            try:
-                args = json.loads(args_str)
-            except json.JSONDecodeError as e:
-                return {"error": f"Invalid JSON arguments: {e}"}
+            # pop with a default: identical calls running in parallel race for the entry
+            args = self._parsed_tool_args.pop(args_str, None)
+            if args is None:
+                try:
+                    args = json_loads(args_str)
+                except json.JSONDecodeError as e:
+                    return {"error": f"Invalid JSON arguments: {e}"}
         
         # Execute with capture if enabled
         if capture_output and self.enhanced_executor:
@@ -478,8 +974,38 @@ class GrokEngine:
             return result
             
         # Direct execution without capture
+        if args_str and tool_name in COALESCED_TOOLS:
+            return self._execute_coalesced(tool_name, args_str, args, brave_api_key)
         return self._execute_tool_internal(tool_name, args, brave_api_key)
     
+    def _execute_coalesced(self, tool_name: str, args_str: str, args: Dict[str, Any], brave_api_key: Optional[str]) -> Dict[str, Any]:
+        """Run a read-only tool, or wait for an identical call that is already running.
+        
+        Callers that join an in-flight call get a shallow copy of its result.
+        """
+        from concurrent.futures import Future
+        
+        key = (tool_name, args_str)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return dict(future.result())
+        
+        try:
+            result = self._execute_tool_internal(tool_name, args, brave_api_key)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
     def _execute_tool_internal(self, function_name: str, arguments: Dict[str, Any], brave_api_key: Optional[str] = None) -> Dict[str, Any]:
         """Internal tool execution logic."""
         # Handle different tools
@@ -487,56 +1013,57 @@ class GrokEngine:
             if not brave_api_key:
                 return {"error": "Brave Search API key not configured"}
             
-            headers = {"X-Subscription-Token": brave_api_key}
-            params = {"q": arguments["query"]}
-            response = requests.get(
-                "https://api.search.brave.com/res/v1/web/search", 
-                headers=headers, 
-                params=params, 
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._brave_search(arguments["query"], brave_api_key)
         
         elif function_name == "read_file":
             filename = arguments["filename"]
-            if os.path.exists(filename):
-                with open(filename, "r", encoding="utf-8") as f:
-                    content = f.read()
-                return {"success": True, "content": content}
-            else:
+            try:
+                return self._read_file(filename, arguments.get("offset", 0), arguments.get("length"))
+            except FileNotFoundError:
                 return {"error": f"File '{filename}' not found"}
         
         elif function_name == "batch_read_files":
             filenames = arguments["filenames"]
-            results = {}
-            for filename in filenames:
-                if os.path.exists(filename):
-                    try:
-                        with open(filename, "r", encoding="utf-8") as f:
-                            content = f.read()
-                        results[filename] = {"success": True, "content": content}
-                    except Exception as e:
-                        results[filename] = {"error": str(e)}
-                else:
-                    results[filename] = {"error": f"File '{filename}' not found"}
-            return {"success": True, "results": results}
+            if len(filenames) > 1:
+                # Reads are I/O bound, so overlapping them in threads turns the
+                # total wait into roughly that of the slowest file
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=min(BATCH_READ_WORKERS, len(filenames))) as pool:
+                    file_results = list(pool.map(self._read_file_result, filenames))
+            else:
+                file_results = [self._read_file_result(filename) for filename in filenames]
+            # Keyed in request order so the output matches a sequential read
+            return {"success": True, "results": dict(zip(filenames, file_results))}
         
         elif function_name == "list_files_recursive":
             directory = arguments["directory"]
-            patterns = self._load_gitignore_patterns()
+            is_ignored = _compile_ignore_patterns(self._load_gitignore_patterns())
             all_files = []
             
-            for root, dirs, files in os.walk(directory):
-                # Remove ignored directories
-                dirs[:] = [d for d in dirs if not self._should_ignore(os.path.join(root, d), patterns)]
+            # Depth-first scandir walk in os.walk order. DirEntry type checks
+            # avoid a stat per entry, and relative paths are built by
+            # prefixing instead of calling os.path.relpath for every file.
+            stack = [(directory, "")]
+            while stack:
+                path, rel_prefix = stack.pop()
+                try:
+                    with os.scandir(path) as it:
+                        entries = list(it)
+                except OSError:
+                    continue
                 
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(file_path, directory)
-                    
-                    if not self._should_ignore(relative_path, patterns):
+                subdirs = []
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, symlinked directories are not followed
+                        if not entry.is_symlink() and not is_ignored(entry.path, entry.name):
+                            subdirs.append((entry.path, rel_prefix + entry.name + os.sep))
+                        continue
+                    name = entry.name
+                    relative_path = rel_prefix + name
+                    if not is_ignored(relative_path, name):
                         all_files.append(relative_path)
+                stack.extend(reversed(subdirs))
             
             return {"success": True, "files": all_files}
         
@@ -546,15 +1073,15 @@ class GrokEngine:
             
             # Security check - ensure file is within source directory
             abs_path = os.path.abspath(filename)
-            if not abs_path.startswith(os.path.abspath(self.source_directory)):
+            if not self._within_source_directory(abs_path):
                 return {"error": "Cannot create file outside source directory"}
             
             # Create directory if needed
             os.makedirs(os.path.dirname(abs_path), exist_ok=True)
             
             # Write file
-            with open(abs_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            _write_bytes(abs_path, _encode_text(content))
+            self._file_cache.invalidate(abs_path)
             
             return {"success": True, "message": f"Created file '{filename}'"}
         
@@ -563,21 +1090,34 @@ class GrokEngine:
             old_str = arguments["old_str"]
             new_str = arguments["new_str"]
             
-            if not os.path.exists(filename):
-                return {"error": f"File '{filename}' not found"}
+            if not old_str:
+                return {"error": "old_str must not be empty"}
+            if not self._within_source_directory(filename):
+                return {"error": "Cannot modify file outside source directory"}
             
-            # Read file content
-            with open(filename, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Work on the raw bytes: no decode/encode round trip
+            try:
+                with open(filename, "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                return {"error": f"File '{filename}' not found"}
             
-            # Replace string
-            if old_str in content:
-                new_content = content.replace(old_str, new_str)
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(new_content)
-                return {"success": True, "message": f"Replaced string in '{filename}'"}
-            else:
+            # One find locates the first match; replacing in the remainder
+            # covers any others, so the file is scanned once
+            old_bytes = _encode_text(old_str)
+            new_bytes = _encode_text(new_str)
+            i = data.find(old_bytes)
+            if i < 0 and b"\r\n" in data and b"\n" in old_bytes:
+                # Text-mode reads used to hide CRLF line endings; match the
+                # file's own endings and keep them in the replacement
+                old_bytes = _to_crlf(old_bytes)
+                new_bytes = _to_crlf(new_bytes)
+                i = data.find(old_bytes)
+            if i < 0:
                 return {"error": f"String '{old_str}' not found in file"}
+            _write_bytes(filename, data[:i] + new_bytes + data[i + len(old_bytes):].replace(old_bytes, new_bytes))
+            self._file_cache.invalidate(filename)
+            return {"success": True, "message": f"Replaced string in '{filename}'"}
         
         elif function_name == "run_shell":
             command = arguments["command"]
@@ -616,53 +1156,124 @@ class GrokEngine:
         else:
             return {"error": f"Unknown tool: {function_name}"}
     
-    def _load_gitignore_patterns(self) -> List[str]:
-        """Load patterns from .gitignore file."""
+    def _within_source_directory(self, path: str) -> bool:
+        """Check that path, with '..' and symlinks resolved, lies inside the source directory."""
+        if self._source_real is None:
+            return False
+        try:
+            return os.path.commonpath([os.path.realpath(path), self._source_real]) == self._source_real
+        except ValueError:
+            # Different drives on Windows
+            return False
+    
+    def _read_file(self, filename: str, offset: int = 0, length: Optional[int] = None) -> Dict[str, Any]:
+        """Read a whole file through the content cache, or a byte range of it.
+        
+        Whole files over MAX_READ_BYTES are not loaded; their first
+        MAX_READ_BYTES come back with "truncated" set.
+        """
+        if offset or length is not None:
+            return self._read_file_slice(filename, offset, length)
+        content = self._file_cache.read(filename, MAX_READ_BYTES)
+        if content is None:
+            result = self._read_file_slice(filename, 0, MAX_READ_BYTES)
+            result["truncated"] = True
+            return result
+        return {"success": True, "content": content}
+    
+    def _read_file_slice(self, filename: str, offset: int, length: Optional[int]) -> Dict[str, Any]:
+        """Read up to length bytes (capped at MAX_READ_BYTES) from offset, decoded as UTF-8."""
+        if offset < 0 or (length is not None and length < 0):
+            return {"error": "offset and length must not be negative"}
+        length = MAX_READ_BYTES if length is None else min(length, MAX_READ_BYTES)
+        with open(filename, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            f.seek(offset)
+            data = f.read(length)
+        # A range can split a multi-byte character at either end
+        return {
+            "success": True,
+            "content": data.decode("utf-8", errors="replace"),
+            "offset": offset,
+            "bytes_read": len(data),
+            "size": size,
+        }
+    
+    def _read_file_result(self, filename: str) -> Dict[str, Any]:
+        """Read one file for batch_read_files, reporting failures per file."""
+        try:
+            return self._read_file(filename)
+        except FileNotFoundError:
+            return {"error": f"File '{filename}' not found"}
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def _brave_search(self, query: str, brave_api_key: str) -> Dict[str, Any]:
+        """Query the Brave web search API over the shared keep-alive session.
+        
+        Results are kept for BRAVE_CACHE_TTL seconds in a small LRU keyed by
+        the case- and whitespace-normalized query.
+        """
+        use_cache = not os.getenv("GROK_NO_SEARCH_CACHE")
+        key = " ".join(query.lower().split())
+        if use_cache:
+            with self._brave_cache_lock:
+                entry = self._brave_cache.get(key)
+                if entry is not None and time.monotonic() - entry[0] < BRAVE_CACHE_TTL:
+                    self._brave_cache.move_to_end(key)
+                    # Copy so callers can annotate the result without touching the cache
+                    return dict(entry[1])
+        
+        headers = {"X-Subscription-Token": brave_api_key}
+        params = {"q": query}
+        self._brave_bucket.acquire()
+        response = _SESSION.get(BRAVE_SEARCH_URL, headers=headers, params=params, timeout=10)
+        response.raise_for_status()
+        # Parse the body bytes directly rather than via requests' json()
+        result = json_loads(response.content)
+        
+        if use_cache:
+            with self._brave_cache_lock:
+                self._brave_cache[key] = (time.monotonic(), result)
+                self._brave_cache.move_to_end(key)
+                if len(self._brave_cache) > BRAVE_CACHE_SIZE:
+                    self._brave_cache.popitem(last=False)
+            return dict(result)
+        return result
+    
+    def _load_gitignore_patterns(self) -> Tuple[str, ...]:
+        """Load patterns from .gitignore file, re-reading it only when it changes."""
+        # Keyed by absolute path too: the cd tool can change the working directory
+        path = os.path.abspath('.gitignore')
+        try:
+            key = (path, os.stat(path).st_mtime_ns)
+        except OSError:
+            return ()
+        if self._gitignore_cache is not None and self._gitignore_cache[0] == key:
+            return self._gitignore_cache[1]
+        
         patterns = []
-        if os.path.exists('.gitignore'):
-            with open('.gitignore', 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        patterns.append(line)
+        with open(path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    patterns.append(line)
+        patterns = tuple(patterns)
+        self._gitignore_cache = (key, patterns)
         return patterns
     
-    def _should_ignore(self, path: str, patterns: List[str]) -> bool:
+    def _should_ignore(self, path: str, patterns: Tuple[str, ...]) -> bool:
         """Check if a path should be ignored based on gitignore patterns."""
-        for pattern in patterns:
-            if pattern.endswith('/'):
-                if path.startswith(pattern) or ('/' + pattern) in path:
-                    return True
-            elif pattern in path or path.endswith(pattern):
-                return True
-            elif '*' in pattern:
-                import fnmatch
-                if fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(os.path.basename(path), pattern):
-                    return True
-        return False
+        return _compile_ignore_patterns(tuple(patterns))(path)
     
     def _execute_shell_command(self, command: str, args: List[str]) -> Dict[str, Any]:
         """Execute shell commands within the source directory boundary."""
-        import subprocess
-        import shlex
-        
-        # Allowed commands for security
-        allowed_commands = {
-            'cat': self._shell_cat,
-            'echo': self._shell_echo,
-            'touch': self._shell_touch,
-            'mkdir': self._shell_mkdir,
-            'rm': self._shell_rm,
-            'cd': self._shell_cd,
-            'ls': self._shell_ls,
-            'pwd': self._shell_pwd
-        }
-        
-        if command not in allowed_commands:
-            return {"error": f"Command '{command}' not allowed. Available: {', '.join(allowed_commands.keys())}"}
+        handler = self._SHELL_DISPATCH.get(command)
+        if handler is None:
+            return {"error": f"Command '{command}' not allowed. Available: {', '.join(self._SHELL_DISPATCH)}"}
         
         try:
-            return allowed_commands[command](args)
+            return handler(self, args)
         except Exception as e:
             return {"error": f"Command failed: {str(e)}"}
     
@@ -698,9 +1309,11 @@ class GrokEngine:
         results = {}
         for filename in args:
             try:
-                # Create file if it doesn't exist, update timestamp if it does
-                with open(filename, "a", encoding="utf-8"):
-                    pass
+                # Update timestamp if the file exists, create it if it doesn't
+                try:
+                    os.utime(filename)
+                except FileNotFoundError:
+                    os.close(os.open(filename, os.O_WRONLY | os.O_CREAT, 0o666))
                 results[filename] = {"success": True, "message": f"Touched '{filename}'"}
             except Exception as e:
                 results[filename] = {"error": str(e)}
@@ -728,7 +1341,15 @@ class GrokEngine:
         for path in paths:
             try:
                 if create_parents:
-                    os.makedirs(path, exist_ok=True)
+                    # Usually the parent exists, so one mkdir does it; makedirs
+                    # (a stat per path component) only runs when it does not
+                    try:
+                        os.mkdir(path)
+                    except FileNotFoundError:
+                        os.makedirs(path, exist_ok=True)
+                    except FileExistsError:
+                        if not os.path.isdir(path):
+                            raise
                 else:
                     os.mkdir(path)
                 results[path] = {"success": True, "message": f"Created directory '{path}'"}
@@ -765,19 +1386,27 @@ class GrokEngine:
         results = {}
         for path in paths:
             try:
-                if os.path.isfile(path):
-                    os.remove(path)
-                    results[path] = {"success": True, "message": f"Removed file '{path}'"}
-                elif os.path.isdir(path):
-                    if recursive:
-                        import shutil
-                        shutil.rmtree(path)
-                        results[path] = {"success": True, "message": f"Removed directory '{path}'"}
-                    else:
-                        results[path] = {"error": f"rm: cannot remove '{path}': Is a directory (use -r for recursive)"}
-                else:
+                # Try the unlink first: for plain files (the common case) that
+                # is the only syscall, instead of isfile + isdir + remove
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
                     if not force:
                         results[path] = {"error": f"rm: cannot remove '{path}': No such file or directory"}
+                    continue
+                except OSError:
+                    # EISDIR on Linux, EPERM on macOS; anything else is a real failure
+                    if not os.path.isdir(path):
+                        raise
+                else:
+                    results[path] = {"success": True, "message": f"Removed file '{path}'"}
+                    continue
+                
+                if recursive:
+                    _parallel_rmtree(path)
+                    results[path] = {"success": True, "message": f"Removed directory '{path}'"}
+                else:
+                    results[path] = {"error": f"rm: cannot remove '{path}': Is a directory (use -r for recursive)"}
             except Exception as e:
                 results[path] = {"error": str(e)}
         
@@ -787,7 +1416,9 @@ class GrokEngine:
         """Implementation of cd command."""
         if not args:
             # cd with no args goes to home directory
-            target = os.path.expanduser("~")
+            if self._home is None:
+                self._home = os.path.expanduser("~")
+            target = self._home
         else:
             target = args[0]
         
@@ -804,12 +1435,27 @@ class GrokEngine:
         path = args[0] if args else "."
         
         try:
-            if os.path.isfile(path):
+            # One stat answers both "is it a file" and "is it a directory"
+            try:
+                mode = os.stat(path).st_mode
+            except (OSError, ValueError):
+                # Same cases os.path.isfile/isdir treat as "neither"
+                mode = 0
+            if stat.S_ISREG(mode):
                 return {"success": True, "command": "ls", "files": [path], "type": "file"}
-            elif os.path.isdir(path):
-                files = os.listdir(path)
+            elif stat.S_ISDIR(mode):
+                # scandir hands back each entry's type from the directory read
+                # itself, so listing subdirectories costs no extra syscalls
+                files = []
+                dirs = []
+                with os.scandir(path) as it:
+                    for entry in it:
+                        files.append(entry.name)
+                        if entry.is_dir():
+                            dirs.append(entry.name)
                 files.sort()
-                return {"success": True, "command": "ls", "files": files, "directory": path}
+                dirs.sort()
+                return {"success": True, "command": "ls", "files": files, "dirs": dirs, "directory": path}
             else:
                 return {"error": f"ls: cannot access '{path}': No such file or directory"}
         except Exception as e:
@@ -823,6 +1469,18 @@ class GrokEngine:
         except Exception as e:
             return {"error": f"pwd: {str(e)}"}
     
+    # Allowed commands for security, mapped to their implementations above
+    _SHELL_DISPATCH = MappingProxyType({
+        'cat': _shell_cat,
+        'echo': _shell_echo,
+        'touch': _shell_touch,
+        'mkdir': _shell_mkdir,
+        'rm': _shell_rm,
+        'cd': _shell_cd,
+        'ls': _shell_ls,
+        'pwd': _shell_pwd
+    })
+    
     def api_call(self, key: str, messages: List[Dict[str, Any]], model: str, 
                  stream: bool, tools: Optional[List[Dict[str, Any]]] = None, 
                  retry_count: int = 0, reasoning: bool = False):
@@ -835,6 +1493,7 @@ class GrokEngine:
         # Cost estimation before API call
         if self.cost_tracking_enabled and self.token_counter:
             input_tokens = self.token_counter.count_messages_tokens(messages, model)
+            self._last_input_tokens = input_tokens
             estimate = self.token_counter.estimate_cost(
                 input_text="", # We already have token count
                 expected_output_tokens=500,  # Reasonable default
@@ -852,39 +1511,34 @@ class GrokEngine:
             # print(f"Estimated cost: ${estimate['total_estimated_cost']:.4f} ({input_tokens} input tokens)")
             self.token_counter.display_cost_warning(estimate["total_estimated_cost"])
         
-        # Calculate adaptive delay based on recent activity
-        time_since_last = time.time() - self.last_request_time
-        if time_since_last < 1.0:  # If less than 1 second, wait a bit
-            delay = 1.0 - time_since_last
-            print(f">> Pacing request... ({delay:.1f}s)")
-            time.sleep(delay)
-        
-        fun_messages = [
-            ">> Optimizing request for best results...",
-            ">> Launching your perfectly timed query...",
-            ">> Grok is ready and waiting...",
-            ">> Request dispatched with optimal timing...",
-            ">> The optimized show begins...",
-        ]
-        
-        try:
-            if XAI_SDK_AVAILABLE and not stream:
-                # Use SDK for non-streaming requests (more reliable)
-                return self._api_call_sdk(messages, model, stream, tools, reasoning, retry_count, fun_messages)
-            else:
-                # Use requests for streaming or when SDK unavailable
-                return self._api_call_requests(key, messages, model, stream, tools, reasoning, retry_count, fun_messages)
-        except Exception as e:
-            if retry_count >= 8:
-                print("\n>> Tip: The optimized CLI is working! Consider spreading requests further apart.")
-                raise Exception(f"API Error after 8 attempts: {e}")
+        # Retries loop here so the cost estimate above runs once per call
+        while True:
+            # Short bursts (e.g. tool-call round trips) go straight out; only
+            # sustained traffic above API_RATE_LIMIT is paced. Every attempt
+            # is a real request, so retries draw from the bucket too.
+            delay = self._api_bucket.reserve()
+            if delay > 0:
+                print(f">> Pacing request... ({delay:.1f}s)")
+                time.sleep(delay)
             
-            print(f"\nRetrying API call (attempt {retry_count + 1}/8)...")
-            return self.api_call(key, messages, model, stream, tools, retry_count + 1, reasoning)
+            try:
+                if XAI_SDK_AVAILABLE and not stream:
+                    # Use SDK for non-streaming requests (more reliable)
+                    return self._api_call_sdk(messages, model, stream, tools, reasoning, retry_count)
+                else:
+                    # Use requests for streaming or when SDK unavailable
+                    return self._api_call_requests(key, messages, model, stream, tools, reasoning, retry_count)
+            except Exception as e:
+                if retry_count >= 8:
+                    print("\n>> Tip: The optimized CLI is working! Consider spreading requests further apart.")
+                    raise Exception(f"API Error after 8 attempts: {e}")
+                
+                retry_count += 1
+                print(f"\nRetrying API call (attempt {retry_count}/8)...")
     
     def _api_call_sdk(self, messages: List[Dict[str, Any]], model: str, stream: bool, 
                      tools: Optional[List[Dict[str, Any]]], reasoning: bool, 
-                     retry_count: int, fun_messages: List[str]):
+                     retry_count: int):
         """Make API call using xAI SDK."""
         try:
             # Convert messages to SDK format
@@ -906,68 +1560,10 @@ class GrokEngine:
             for msg in sdk_messages:
                 chat.append(msg)
             
-            # Get response
-            if reasoning:
-                # SDK handles reasoning automatically - just sample
-                response = chat.sample()
-                
-                # Create a wrapper object that mimics our expected interface
-                class SDKResponseWrapper:
-                    def __init__(self, sdk_response):
-                        self.sdk_response = sdk_response
-                        self.content = sdk_response.content
-                        self.reasoning_content = getattr(sdk_response, 'reasoning_content', '')
-                        self.usage = sdk_response.usage
-                        self.choices = [self._create_choice()]
-                    
-                    def _create_choice(self):
-                        class Choice:
-                            def __init__(self, content):
-                                self.message = type('Message', (), {'content': content})()
-                        return Choice(self.content)
-                    
-                    def json(self):
-                        return {
-                            "choices": [{"message": {"content": self.content}}],
-                            "usage": {
-                                "prompt_tokens": self.usage.prompt_tokens,
-                                "completion_tokens": self.usage.completion_tokens,
-                                "reasoning_tokens": getattr(self.usage, 'reasoning_tokens', 0),
-                                "total_tokens": self.usage.prompt_tokens + self.usage.completion_tokens
-                            }
-                        }
-                
-                self.last_request_time = time.time()
-                return SDKResponseWrapper(response)
-            else:
-                # Regular response
-                response = chat.sample()
-                
-                class SDKResponseWrapper:
-                    def __init__(self, sdk_response):
-                        self.sdk_response = sdk_response
-                        self.content = sdk_response.content
-                        self.usage = sdk_response.usage
-                        self.choices = [self._create_choice()]
-                    
-                    def _create_choice(self):
-                        class Choice:
-                            def __init__(self, content):
-                                self.message = type('Message', (), {'content': content})()
-                        return Choice(self.content)
-                    
-                    def json(self):
-                        return {
-                            "choices": [{"message": {"content": self.content}}],
-                            "usage": {
-                                "prompt_tokens": self.usage.prompt_tokens,
-                                "completion_tokens": self.usage.completion_tokens,
-                                "total_tokens": self.usage.prompt_tokens + self.usage.completion_tokens
-                            }
-                        }
-                
-                self.last_request_time = time.time()
-                return SDKResponseWrapper(response)
+            # Get response (the SDK handles reasoning automatically - just sample)
+            response = chat.sample()
+            self.last_request_time = time.time()
+            return _SDKResponseWrapper(response, reasoning=reasoning)
                 
         except Exception as e:
             print(f"SDK call failed: {e}")
@@ -975,75 +1571,155 @@ class GrokEngine:
     
     def _api_call_requests(self, key: str, messages: List[Dict[str, Any]], model: str, 
                           stream: bool, tools: Optional[List[Dict[str, Any]]], 
-                          reasoning: bool, retry_count: int, fun_messages: List[str]):
+                          reasoning: bool, retry_count: int):
         """Fallback API call using requests (original implementation)."""
         headers = {"Authorization": f"Bearer {key}", "Content-Type": "application/json"}
         
         # Handle reasoning mode
         if reasoning:
             # Try reasoning model first
-            if model in REASONING_MODELS:
-                reasoning_model = REASONING_MODELS[model]
-                data = {"messages": messages, "model": reasoning_model, "stream": stream}
+            reasoning_model = REASONING_MODELS.get(model)
+            if reasoning_model is not None:
+                data = {"model": reasoning_model, "stream": stream}
             else:
                 # Fall back to parameter-based reasoning
-                data = {"messages": messages, "model": model, "stream": stream, "reasoning": True}
+                data = {"model": model, "stream": stream, "reasoning": True}
         else:
-            data = {"messages": messages, "model": model, "stream": stream}
+            data = {"model": model, "stream": stream}
         
+        # Serialize once; rate-limit retries resend the same bytes. The body
+        # is assembled from parts so the system message and the default tool
+        # list reuse their cached JSON and only the conversation is encoded.
+        parts = [b'{"messages":', self._encode_messages(messages), b",", json_dumps_bytes(data)[1:-1]]
         if tools:
-            data["tools"] = tools
-            data["tool_choice"] = "auto"
+            tools_json = self._tools_json if tools is self.tools else json_dumps_bytes(tools)
+            parts += [b',"tools":', tools_json, b',"tool_choice":"auto"']
+        parts.append(b"}")
+        body = b"".join(parts)
         
-        try:
-            response = requests.post(API_URL, headers=headers, json=data, stream=stream, timeout=(10, 60))
-            response.raise_for_status()
-            self.last_request_time = time.time()
-            return response
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 429:
+        while True:
+            try:
+                response = _SESSION.post(API_URL, headers=headers, data=body, stream=stream, timeout=(10, 60))
+                response.raise_for_status()
+                self.last_request_time = time.time()
+                return response
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code != 429:
+                    raise e
+                # Release the connection back to the pool before waiting
+                e.response.close()
                 retry_count += 1
                 
-                # Check for Retry-After header
+                # Check for Retry-After header (delta-seconds or an HTTP-date)
                 retry_after = e.response.headers.get('Retry-After')
+                wait_time = None
                 if retry_after:
                     try:
                         wait_time = int(retry_after)
                     except ValueError:
-                        wait_time = min(5 * (2 ** (retry_count - 1)) + random.random() * 3, 60)
-                else:
-                    wait_time = min(5 * (2 ** (retry_count - 1)) + random.random() * 3, 60)
+                        parsed = parsedate_tz(retry_after)
+                        if parsed:
+                            wait_time = max(0, mktime_tz(parsed) - time.time())
+                if wait_time is None:
+                    base = _BACKOFF_BASE[min(retry_count, len(_BACKOFF_BASE)) - 1]
+                    wait_time = min(base + random.random() * 3, _BACKOFF_CAP)
                 
-                # Use fun message
-                msg_index = retry_count % len(fun_messages)
-                print(f"\n{fun_messages[msg_index]}")
+                # Use fun message; rotation order doesn't matter, so just pick one
+                print(f"\n{random.choice(_FUN_MESSAGES)}")
                 print(f"Rate limit - optimizing timing. Waiting {wait_time:.1f}s... (attempt {retry_count}/8)")
                 
                 if retry_count >= 8:
                     print("\n>> Tip: The optimized CLI is working! Consider spreading requests further apart.")
                     raise Exception("API Error: Too many requests. The optimization is working - just need to pace things more.")
                 
-                # Enhanced progress bar
-                start_time = time.time()
-                while time.time() - start_time < wait_time:
-                    elapsed = time.time() - start_time
-                    progress = int((elapsed / wait_time) * 30)
-                    bar = "#" * progress + "-" * (30 - progress)
-                    remaining = wait_time - elapsed
-                    print(f"[{bar}] {remaining:.1f}s remaining", end="\r", flush=True)
-                    time.sleep(0.1)
-                print(" " * 50, end="\r")
+                show_progress_bar(wait_time)
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"API Error: {e}")
+    
+    def _dispatch_tool_calls(self, tool_calls: List[Dict[str, Any]], messages: List[Dict[str, Any]],
+                             brave_key: Optional[str], is_debug: bool,
+                             capture_output: bool = False) -> Tuple[int, List[str]]:
+        """Run one turn's tool calls and append their results to messages.
+        
+        Returns the number of failed calls and any output captured for the
+        Grid UI (only collected when capture_output is set).
+        """
+        tool_call_failures = 0
+        captured_outputs = []
+        tool_contents = []  # Serialized result per tool call, in order
+        total = len(tool_calls)
+        
+        # Read-only tools print nothing and change no files, so there is no
+        # Grid UI output to capture for them. They skip capture (which swaps
+        # the process-wide sys.stdout) and so can share the pool even when
+        # the rest of the turn is captured.
+        runs = _read_only_runs(tool_calls)
+        pool = None
+        started = {}  # Index -> Future for read-only calls submitted ahead of their turn
+        if runs:
+            from concurrent.futures import ThreadPoolExecutor
+            longest = max(end - start for start, end in runs.items())
+            pool = ThreadPoolExecutor(max_workers=min(TOOL_CALL_WORKERS, longest))
+        
+        try:
+            for i, tool_call in enumerate(tool_calls, 1):
+                if i - 1 in runs:
+                    # Submit the whole run only once every earlier call has finished
+                    for j in range(i - 1, runs[i - 1]):
+                        started[j] = pool.submit(self.execute_tool_call, tool_calls[j], brave_key)
+                tool_name = tool_call['function']['name']
+                # Each status block goes out in one write instead of a print per line
+                sys.stdout.write(f"  >> Getting {tool_name} from the toolchest ({i}/{total})\n"
+                                 f"     {get_random_message('thinking')}\n")
                 
-                return self._api_call_requests(key, messages, model, stream, tools, reasoning, retry_count, fun_messages)
-            else:
-                raise e
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"API Error: {e}")
+                try:
+                    future = started.pop(i - 1, None)
+                    if future is not None:
+                        result = future.result()
+                    else:
+                        capture = capture_output and tool_name not in COALESCED_TOOLS
+                        result = self.execute_tool_call(tool_call, brave_key, capture_output=capture)
+                    
+                    # Extract captured output if present
+                    if "_captured_output" in result:
+                        captured = result.pop("_captured_output")
+                        if captured:
+                            captured_outputs.append(captured)
+                    
+                    # Serialized once; the debug output shows the same JSON the model gets
+                    content = json_dumps(result)
+                    if "error" in result:
+                        tool_call_failures += 1
+                        status = f"     [FAILED] {tool_name}: {result['error']}\n"
+                    else:
+                        status = f"     [DONE] {tool_name} completed successfully\n"
+                    if is_debug:
+                        status += f"Tool result: {content}\n"
+                    sys.stdout.write(status)
+                    
+                    tool_contents.append(content)
+                    
+                except Exception as e:
+                    tool_call_failures += 1
+                    error_result = {"error": f"Tool execution exception: {str(e)}"}
+                    print(f"     [EXCEPTION] {tool_name}: {str(e)}")
+                    
+                    tool_contents.append(json_dumps(error_result))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        
+        messages.extend([
+            {"role": "tool", "tool_call_id": tool_call["id"], "content": content}
+            for tool_call, content in zip(tool_calls, tool_contents)
+        ])
+        return tool_call_failures, captured_outputs
     
     def run_chat_loop(self, args, key: str, brave_key: Optional[str], messages: List[Dict[str, Any]]) -> None:
         """Core loop for processing messages and tool calls."""
         max_iterations = 10
         iteration = 0
+        is_debug = args.debug if args.debug is not None else bool(os.getenv("GROK_DEBUG"))
         
         while iteration < max_iterations:
             iteration += 1
@@ -1058,13 +1734,15 @@ class GrokEngine:
                 
                 # For streaming, estimate token usage since it's not provided in the stream
                 if self.cost_tracking_enabled and self.token_counter and assistant_content:
+                    # api_call already counted this message list for its estimate
+                    input_tokens = self._last_input_tokens
+                    if input_tokens is None:
+                        input_tokens = self.token_counter.count_messages_tokens(messages, args.model)
                     # Validate assistant_content before token counting
                     if isinstance(assistant_content, str) and assistant_content.strip():
-                        input_tokens = self.token_counter.count_messages_tokens(messages, args.model)
                         output_tokens = self.token_counter.count_tokens(assistant_content)
                     else:
                         # Handle invalid or empty content
-                        input_tokens = self.token_counter.count_messages_tokens(messages, args.model)
                         output_tokens = 0
                     
                     self.token_counter.track_api_call(
@@ -1091,51 +1769,10 @@ class GrokEngine:
                 print(f"\n[Calling {len(tool_calls)} tool(s)...]")
                 messages.append({"role": "assistant", "content": assistant_content or None, "tool_calls": tool_calls})
                 
-                # Execute tool calls directly
-                tool_call_failures = 0
-                all_tool_outputs = []  # Collect all tool outputs for Grid UI
-                
-                for i, tool_call in enumerate(tool_calls, 1):
-                    tool_name = tool_call['function']['name']
-                    print(f"  >> Getting {tool_name} from the toolchest ({i}/{len(tool_calls)})")
-                    print(f"     {get_random_message('thinking')}")
-                    
-                    try:
-                        # Execute with output capture for Grid UI
-                        result = self.execute_tool_call(tool_call, brave_key, capture_output=True)
-                        
-                        # Extract captured output if present
-                        if "_captured_output" in result:
-                            captured = result.pop("_captured_output")
-                            if captured:
-                                all_tool_outputs.append(captured)
-                        
-                        if "error" in result:
-                            tool_call_failures += 1
-                            print(f"     [FAILED] {tool_name}: {result['error']}")
-                        else:
-                            print(f"     [DONE] {tool_name} completed successfully")
-                        
-                        is_debug = args.debug if args.debug is not None else bool(os.getenv("GROK_DEBUG"))
-                        if is_debug:
-                            print(f"Tool result: {json.dumps(result, indent=2)}")
-                        
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call["id"],
-                            "content": json.dumps(result)
-                        })
-                        
-                    except Exception as e:
-                        tool_call_failures += 1
-                        error_result = {"error": f"Tool execution exception: {str(e)}"}
-                        print(f"     [EXCEPTION] {tool_name}: {str(e)}")
-                        
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call["id"],
-                            "content": json.dumps(error_result)
-                        })
+                # Execute tool calls directly, capturing output for Grid UI
+                tool_call_failures, all_tool_outputs = self._dispatch_tool_calls(
+                    tool_calls, messages, brave_key, is_debug, capture_output=True
+                )
                 
                 if tool_call_failures == len(tool_calls):
                     print("\n[ERROR] All tool calls failed. Asking Grok to retry...")
@@ -1163,7 +1800,7 @@ class GrokEngine:
                 
             else:
                 # Non-streaming mode (requests)
-                response_json = response.json()
+                response_json = json_loads(response.content)
                 message = response_json["choices"][0]["message"]
                 
                 # Track API response for cost calculation
@@ -1181,37 +1818,7 @@ class GrokEngine:
                 messages.append(message)
                 
                 # Execute tool calls directly
-                for i, tool_call in enumerate(message["tool_calls"], 1):
-                    tool_name = tool_call['function']['name']
-                    print(f"  >> Getting {tool_name} from the toolchest ({i}/{len(message['tool_calls'])})")
-                    print(f"     {get_random_message('thinking')}")
-                    try:
-                        result = self.execute_tool_call(tool_call, brave_key)
-                        
-                        if "error" in result:
-                            print(f"     [FAILED] {tool_name}: {result['error']}")
-                        else:
-                            print(f"     [DONE] {tool_name} completed successfully")
-                        
-                        is_debug = args.debug if args.debug is not None else bool(os.getenv("GROK_DEBUG"))
-                        if is_debug:
-                            print(f"Tool result: {json.dumps(result, indent=2)}")
-                        
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call["id"],
-                            "content": json.dumps(result)
-                        })
-                        
-                    except Exception as e:
-                        error_result = {"error": f"Tool execution exception: {str(e)}"}
-                        print(f"     [EXCEPTION] {tool_name}: {str(e)}")
-                        
-                        messages.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call["id"],
-                            "content": json.dumps(error_result)
-                        })
+                self._dispatch_tool_calls(message["tool_calls"], messages, brave_key, is_debug)
                 
                 print("\n[Getting response...]")
         
@@ -27,7 +27,9 @@ class GridRenderer:
         self.status_height = 1
         
         # Calculate AI window height (remaining space)
-        self.ai_window_height = max(10, self.height - self.header_height - self.input_height - self.status_height - 2)
+        self.ai_window_height = self.compute_ai_window_height(
+            self.height, self.header_height, self.input_height, self.status_height
+        )
         
         # Color support
         self.colors = self._init_colors()
@@ -41,6 +43,16 @@ class GridRenderer:
         self.input_content = {"text": "", "cursor_pos": 0}
         self.status_content = {"message": "Ready", "cost": "$0.0000", "tokens": "0"}
         
+    @staticmethod
+    def compute_ai_window_height(height: int, header_height: int = 3,
+                                 input_height: int = 3, status_height: int = 1) -> int:
+        """Return the AI window height for a terminal of the given height.
+
+        Depends only on the layout, so callers can size the chat area
+        without constructing a renderer. Width does not affect it.
+        """
+        return max(10, height - header_height - input_height - status_height - 2)
+
     def _init_colors(self):
         """Initialize color codes with Windows compatibility."""
         if os.name == 'nt':
@@ -17,6 +17,7 @@ from .input_handler import MultiLineInputHandler, GroKitInterface
 from .grid_ui import GridRenderer, VersionManager
 from .persistence import PersistentStorage
 from .enhanced_input import EnhancedInputHandler
+from .utils import json_loads
 
 
 class GroKitUI(GroKitInterface):
@@ -810,8 +811,7 @@ Tips:
                 self.renderer.ai_content[assistant_msg_index]['content'] = "Error: No XAI_API_KEY found."
                 return
 
-            system_prompt = self.engine.get_enhanced_system_prompt()
-            messages = [{"role": "system", "content": system_prompt}]
+            messages = [self.engine.get_system_message()]
             
             # Add conversation history from the renderer's content
             for msg in self.renderer.ai_content[:-1]: # Exclude the current placeholder
@@ -857,7 +857,7 @@ Tips:
                             break
                         
                         try:
-                            chunk_data = json.loads(data_str)
+                            chunk_data = json_loads(data_str)
                             if 'choices' in chunk_data and chunk_data['choices']:
                                 delta = chunk_data['choices'][0].get('delta', {})
                                 content_chunk = delta.get('content')
@@ -899,9 +899,8 @@ Tips:
                 return "Error: No XAI_API_KEY found. Please set your API key in environment variables.", None
             
             # Create messages for the conversation with enhanced system prompt
-            system_prompt = self.engine.get_enhanced_system_prompt()
             messages = [
-                {"role": "system", "content": system_prompt},
+                self.engine.get_system_message(),
                 {"role": "user", "content": user_input}
             ]
             
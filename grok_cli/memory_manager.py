@@ -305,9 +305,12 @@ class MemoryManager:
             session_files = list(self.session_dir.glob("session_*.json"))
             stats["session_files"] = len(session_files)
             
-            # Count history files  
-            history_files = list(self.history_dir.glob("chat_*.json"))
-            stats["history_files"] = len(history_files)
+            # Count history files (only the count is needed, so skip Path objects)
+            with os.scandir(self.history_dir) as entries:
+                stats["history_files"] = sum(
+                    1 for e in entries
+                    if e.name.startswith("chat_") and e.name.endswith(".json")
+                )
             
             # Count total messages and sessions
             total_messages = 0
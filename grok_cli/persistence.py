@@ -10,6 +10,8 @@ from typing import Dict, List, Optional, Any
 from pathlib import Path
 import shutil
 
+from .utils import json_dumps_bytes
+
 
 class PersistentStorage:
     """Manage persistent storage for chat history and session data."""
@@ -75,8 +77,8 @@ class PersistentStorage:
     def _save_session_data(self, data: Dict):
         """Save session data to file."""
         try:
-            with open(self.session_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(self.session_file, 'wb') as f:
+                f.write(json_dumps_bytes(data, pretty=True))
         except Exception as e:
             print(f"Warning: Could not save session data: {e}")
     
@@ -140,8 +142,8 @@ class PersistentStorage:
         
         # Save updated history
         try:
-            with open(history_file, 'w', encoding='utf-8') as f:
-                json.dump(history_data, f, indent=2, ensure_ascii=False)
+            with open(history_file, 'wb') as f:
+                f.write(json_dumps_bytes(history_data, pretty=True))
         except Exception as e:
             print(f"Warning: Could not save daily history: {e}")
     
@@ -305,8 +307,8 @@ class PersistentStorage:
         }
         
         try:
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            with open(export_path, 'wb') as f:
+                f.write(json_dumps_bytes(export_data, pretty=True))
             return export_path
         except Exception as e:
             raise Exception(f"Failed to export session: {e}")
@@ -3,9 +3,9 @@ Request Management for Grok CLI
 Handles batching, caching, and rate limiting
 """
 
-import asyncio
 import time
 import json
+import threading
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
@@ -26,6 +26,37 @@ class BatchedRequest:
     timestamp: float
     cache_key: Optional[str] = None
 
+class TokenBucket:
+    """Token-bucket rate limiter
+
+    Allows bursts of up to `burst` calls, then throttles to `rate` calls
+    per second on average. Thread-safe; callers that find the bucket empty
+    are queued behind each other rather than all waking at once.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> float:
+        """Block until a token is available; returns the time spent waiting"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
 class RequestManager:
     def __init__(self, min_delay_seconds: float = 0.5):
         self.min_delay_seconds = min_delay_seconds
@@ -116,9 +147,17 @@ class RequestManager:
             try:
                 if recursive:
                     files = []
+                    # os.walk yields roots that start with `directory`, so the
+                    # relative path is a slice plus a prefix; no join/relpath per file
+                    sep = os.sep
+                    base_len = len(directory.rstrip(sep)) + 1
                     for root, dirs, filenames in os.walk(directory):
-                        for filename in filenames:
-                            files.append(os.path.relpath(os.path.join(root, filename), directory))
+                        rel_root = root[base_len:]
+                        if rel_root:
+                            prefix = rel_root + sep
+                            files.extend([prefix + filename for filename in filenames])
+                        else:
+                            files.extend(filenames)
                 else:
                     files = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
                 result = {"success": True, "files": files}
@@ -155,6 +194,9 @@ class RequestManager:
     
     async def process_queue(self) -> Dict[str, Any]:
         """Process queued requests in batches"""
+        # Imported here to keep asyncio off the CLI startup path
+        import asyncio
+        
         if not self.request_queue:
             return {}
         
@@ -3,6 +3,7 @@ StreamingUI - Classic terminal interface with modern Rich formatting
 No screen clearing, no cursor jumping, just smooth streaming goodness!
 """
 
+import json
 import os
 import sys
 import time
@@ -10,6 +11,8 @@ from datetime import datetime
 from typing import Optional, Dict, Any, Generator
 from io import StringIO
 
+from .utils import json_loads
+
 # Rich imports for beautiful formatting
 try:
     from rich.console import Console
@@ -392,8 +395,7 @@ class StreamingAIChat:
                 return error_msg
             
             # Build messages for AI with conversation history
-            system_prompt = self.engine.get_enhanced_system_prompt()
-            messages = [{"role": "system", "content": system_prompt}]
+            messages = [self.engine.get_system_message()]
             
             # Add conversation history from storage
             chat_history = self.storage.get_chat_history()
@@ -428,8 +430,7 @@ class StreamingAIChat:
                             break
                         
                         try:
-                            import json
-                            chunk_data = json.loads(data_str)
+                            chunk_data = json_loads(data_str)
                             
                             if 'choices' in chunk_data and chunk_data['choices']:
                                 delta = chunk_data['choices'][0].get('delta', {})
@@ -6,13 +6,81 @@ for all Grok API operations, including input/output tokens, cached tokens,
 and special operations like live search.
 """
 
+import hashlib
 import json
+import threading
 import time
+from collections import OrderedDict, namedtuple
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from functools import lru_cache
 import os
 
+from .utils import json_dumps_bytes
+
+
+# Encoding shared by every TokenCounter; cl100k_base is compatible with Grok
+TOKENIZER_ENCODING = "cl100k_base"
+
+
+@lru_cache(maxsize=1)
+def _get_encoder():
+    """Return the process-wide tiktoken encoder, or None without tiktoken.
+
+    Loading an encoding reads (and on first use downloads) the BPE ranks, so
+    it is done once per process rather than once per TokenCounter.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        print("WARNING: tiktoken not available. Install with: pip install tiktoken")
+        print("   Token counts will be estimated using character-based approximation.")
+        return None
+    return tiktoken.get_encoding(TOKENIZER_ENCODING)
+
+
+# Token counts are memoised by a digest of the text plus its length, not by
+# the text itself, so large tool results are not kept alive by the cache
+TOKEN_CACHE_SIZE = 4096
+
+TokenCacheInfo = namedtuple("TokenCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_token_counts: "OrderedDict[Tuple[int, bytes], int]" = OrderedDict()
+_token_counts_lock = threading.Lock()
+_token_cache_stats = [0, 0]  # hits, misses
+
+
+def _count_cached(text: str) -> int:
+    """Count tokens in text with the shared encoder, memoised by its digest.
+
+    The same prompts and history messages are re-counted on every API call,
+    so repeats are answered from the cache instead of re-running BPE.
+    """
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    key = (len(text), digest)
+    with _token_counts_lock:
+        count = _token_counts.get(key)
+        if count is not None:
+            _token_counts.move_to_end(key)
+            _token_cache_stats[0] += 1
+            return count
+        _token_cache_stats[1] += 1
+
+    count = len(_get_encoder().encode(text))
+    with _token_counts_lock:
+        _token_counts[key] = count
+        if len(_token_counts) > TOKEN_CACHE_SIZE:
+            _token_counts.popitem(last=False)
+    return count
+
+
+def token_cache_info() -> TokenCacheInfo:
+    """Return hit/miss statistics for the token count cache."""
+    with _token_counts_lock:
+        return TokenCacheInfo(_token_cache_stats[0], _token_cache_stats[1],
+                              TOKEN_CACHE_SIZE, len(_token_counts))
+
 
 @dataclass
 class TokenUsage:
@@ -50,6 +118,16 @@ class SessionCosts:
             self.start_time = datetime.now(timezone.utc).isoformat()
         if self.operations is None:
             self.operations = []
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the same structure as ``asdict(self)``, much faster.
+        
+        asdict deep-copies every recorded operation; all fields here are
+        primitives, so shallow copies of each dataclass are equivalent.
+        """
+        data = self.__dict__.copy()
+        data["operations"] = [op.__dict__.copy() for op in self.operations]
+        return data
 
 
 class GrokPricing:
@@ -79,6 +157,15 @@ class GrokPricing:
         }
     }
     
+    # Per-token (input, cached_input, output) prices derived once from the
+    # matrix, so cost calculations are a multiply instead of lookups + divides
+    PER_TOKEN_PRICES = {
+        model: (prices["input"] / 1_000_000,
+                prices["cached_input"] / 1_000_000,
+                prices["output"] / 1_000_000)
+        for model, prices in PRICING_MATRIX.items()
+    }
+    
     # Live search pricing per 1K searches
     LIVE_SEARCH_COST_PER_1K = 25.00
     
@@ -87,6 +174,33 @@ class GrokPricing:
         """Get pricing for a specific model."""
         return cls.PRICING_MATRIX.get(model, cls.PRICING_MATRIX["grok-4-0709"])
     
+    @classmethod
+    def get_per_token_prices(cls, model: str) -> Tuple[float, float, float]:
+        """Get (input, cached_input, output) USD prices per single token."""
+        return cls.PER_TOKEN_PRICES.get(model, cls.PER_TOKEN_PRICES["grok-4-0709"])
+    
+    @classmethod
+    def estimate_costs_all_models(cls,
+                                  input_tokens: int,
+                                  output_tokens: int,
+                                  cached_tokens: int = 0,
+                                  searches: int = 0) -> Dict[str, Dict[str, float]]:
+        """Price one usage profile for every known model in a single pass."""
+        search_cost = cls.calculate_search_cost(searches)
+        costs = {}
+        for model, (input_price, cached_price, output_price) in cls.PER_TOKEN_PRICES.items():
+            input_cost = input_tokens * input_price
+            cached_cost = cached_tokens * cached_price
+            output_cost = output_tokens * output_price
+            costs[model] = {
+                "input_cost": input_cost,
+                "cached_cost": cached_cost,
+                "output_cost": output_cost,
+                "search_cost": search_cost,
+                "total_cost": input_cost + cached_cost + output_cost + search_cost,
+            }
+        return costs
+    
     @classmethod
     def calculate_token_cost(cls, tokens: int, cost_per_million: float) -> float:
         """Calculate cost for given number of tokens."""
@@ -110,14 +224,7 @@ class TokenCounter:
     
     def _init_tokenizer(self):
         """Initialize the tokenizer for accurate token counting."""
-        try:
-            import tiktoken
-            # Use cl100k_base encoding which is compatible with Grok
-            self.tokenizer = tiktoken.get_encoding("cl100k_base")
-        except ImportError:
-            print("WARNING: tiktoken not available. Install with: pip install tiktoken")
-            print("   Token counts will be estimated using character-based approximation.")
-            self.tokenizer = None
+        self.tokenizer = _get_encoder()
     
     def count_tokens(self, text: str) -> int:
         """Count tokens in text using tiktoken or approximation."""
@@ -133,7 +240,7 @@ class TokenCounter:
             
         if self.tokenizer:
             try:
-                return len(self.tokenizer.encode(text))
+                return _count_cached(text)
             except Exception as e:
                 print(f"Warning: Tokenizer error: {e}, falling back to approximation")
                 # Fall back to approximation if tokenizer fails
@@ -142,6 +249,42 @@ class TokenCounter:
             # Rough approximation: ~4 characters per token
             return max(1, len(text) // 4)
     
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Count tokens for several texts with a single encoder call.
+
+        tiktoken's encode_batch runs the BPE in native threads, so a list of
+        prompts is tokenized in parallel instead of one call per prompt.
+        Each result matches what count_tokens would return for that text.
+        """
+        counts = [0] * len(texts)
+        pending = []
+        indices = []
+        for i, text in enumerate(texts):
+            if text is None:
+                continue
+            if not isinstance(text, str):
+                text = str(text)
+            if text.strip():
+                pending.append(text)
+                indices.append(i)
+        
+        if not pending:
+            return counts
+        
+        if self.tokenizer:
+            try:
+                encoded = self.tokenizer.encode_batch(pending, num_threads=os.cpu_count() or 1)
+                for i, tokens in zip(indices, encoded):
+                    counts[i] = len(tokens)
+                return counts
+            except Exception as e:
+                print(f"Warning: Tokenizer error: {e}, falling back to approximation")
+        
+        # Rough approximation: ~4 characters per token
+        for i, text in zip(indices, pending):
+            counts[i] = max(1, len(text) // 4)
+        return counts
+    
     def count_messages_tokens(self, messages: List[Dict[str, Any]], model: str = "grok-beta") -> int:
         """Count tokens for a list of messages, including system overhead."""
         total_tokens = 0
@@ -186,31 +329,32 @@ class TokenCounter:
         )
         
         # Calculate costs
-        pricing = GrokPricing.get_model_pricing(model)
+        input_price, cached_price, output_price = GrokPricing.get_per_token_prices(model)
         
-        input_cost = GrokPricing.calculate_token_cost(input_tokens, pricing["input"])
-        output_cost = GrokPricing.calculate_token_cost(output_tokens, pricing["output"])
-        cached_cost = GrokPricing.calculate_token_cost(cached_tokens, pricing["cached_input"])
+        input_cost = input_tokens * input_price
+        output_cost = output_tokens * output_price
+        cached_cost = cached_tokens * cached_price
         search_cost = GrokPricing.calculate_search_cost(live_searches)
         
         # Update session totals
-        self.session_costs.total_input_cost += input_cost
-        self.session_costs.total_output_cost += output_cost
-        self.session_costs.total_cached_cost += cached_cost
-        self.session_costs.total_search_cost += search_cost
-        self.session_costs.total_cost = (
-            self.session_costs.total_input_cost + 
-            self.session_costs.total_output_cost + 
-            self.session_costs.total_cached_cost + 
-            self.session_costs.total_search_cost
+        costs = self.session_costs
+        costs.total_input_cost += input_cost
+        costs.total_output_cost += output_cost
+        costs.total_cached_cost += cached_cost
+        costs.total_search_cost += search_cost
+        costs.total_cost = (
+            costs.total_input_cost + 
+            costs.total_output_cost + 
+            costs.total_cached_cost + 
+            costs.total_search_cost
         )
         
-        self.session_costs.total_input_tokens += input_tokens
-        self.session_costs.total_output_tokens += output_tokens
-        self.session_costs.total_cached_tokens += cached_tokens
-        self.session_costs.total_searches += live_searches
+        costs.total_input_tokens += input_tokens
+        costs.total_output_tokens += output_tokens
+        costs.total_cached_tokens += cached_tokens
+        costs.total_searches += live_searches
         
-        self.session_costs.operations.append(usage)
+        costs.operations.append(usage)
         
         self._save_session()
         return usage
@@ -222,11 +366,27 @@ class TokenCounter:
                      include_searches: int = 0) -> Dict[str, float]:
         """Estimate cost for an operation before making the API call."""
         
-        input_tokens = self.count_tokens(input_text)
-        pricing = GrokPricing.get_model_pricing(model)
+        return self.estimate_cost_for_tokens(
+            self.count_tokens(input_text),
+            expected_output_tokens=expected_output_tokens,
+            model=model,
+            include_searches=include_searches
+        )
+    
+    def estimate_cost_for_tokens(self,
+                                 input_tokens: int,
+                                 expected_output_tokens: int = 500,
+                                 model: str = "grok-4-0709",
+                                 include_searches: int = 0) -> Dict[str, float]:
+        """Estimate cost from an already known input token count.
+        
+        Lets callers that price the same input for several models count the
+        tokens once instead of re-tokenizing per model.
+        """
+        input_price, _, output_price = GrokPricing.get_per_token_prices(model)
         
-        input_cost = GrokPricing.calculate_token_cost(input_tokens, pricing["input"])
-        output_cost = GrokPricing.calculate_token_cost(expected_output_tokens, pricing["output"])
+        input_cost = input_tokens * input_price
+        output_cost = expected_output_tokens * output_price
         search_cost = GrokPricing.calculate_search_cost(include_searches)
         
         total_estimated = input_cost + output_cost + search_cost
@@ -344,9 +504,11 @@ class TokenCounter:
     def _save_session(self):
         """Save session data to file."""
         try:
-            session_data = asdict(self.session_costs)
-            with open(self.session_file, 'w') as f:
-                json.dump(session_data, f, indent=2)
+            # Rewritten after every call, so avoid asdict's deep copy and
+            # serialize in one shot (orjson when available)
+            session_data = self.session_costs.to_dict()
+            with open(self.session_file, 'wb') as f:
+                f.write(json_dumps_bytes(session_data, pretty=True))
         except Exception as e:
             print(f"Warning: Could not save session data: {e}")
     
@@ -7,13 +7,72 @@ import base64
 import fnmatch
 import random
 import re
+from functools import lru_cache
+
+# orjson is optional; it serializes large histories several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_dumps_bytes(obj, pretty=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed.
+
+    ``pretty`` indents by two spaces. Non-ASCII text is written as UTF-8
+    rather than escaped. Objects orjson refuses fall back to the stdlib.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False).encode("utf-8")
+
+def json_dumps(obj):
+    """Serialize obj to a compact JSON string, using orjson when it is installed.
+
+    Objects orjson refuses (non-string keys, oversized ints) fall back to
+    the stdlib encoder so callers see the same errors as ``json.dumps``.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj)
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# absolute path -> ((st_mtime_ns, st_size), parsed value)
+_JSON_FILE_CACHE = {}
+
+def load_json_cached(path):
+    """Parse a JSON file, reusing the last result while its mtime and size are unchanged.
+
+    Returns None if the file does not exist. The parsed value is shared
+    between callers, so treat it as read-only.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    with open(fd, "rb") as f:
+        st = os.fstat(fd)
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = os.path.abspath(path)
+        cached = _JSON_FILE_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        value = json_loads(f.read())
+    _JSON_FILE_CACHE[key] = (stamp, value)
+    return value
 
 def load_config():
-    config_path = "settings.json"
-    if os.path.exists(config_path):
-        with open(config_path, "r") as f:
-            return json.load(f)
-    return {}
+    config = load_json_cached("settings.json")
+    return {} if config is None else config
 
 def get_api_key(args):
     key = args.api_key or os.getenv("XAI_API_KEY")
@@ -148,18 +207,28 @@ def strip_emojis_from_message(message):
     
     return clean_message
 
+# Message files ship next to this module; resolve their paths once
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_STARTUP_PATH = os.path.join(_MODULE_DIR, "startup.json")
+_THINKING_PATH = os.path.join(_MODULE_DIR, "thinking.json")
+_MESSAGE_PATHS = {"startup": _STARTUP_PATH, "thinking": _THINKING_PATH}
+
 def load_messages(message_type="startup"):
     """Load messages from JSON files with fallback to simple messages."""
+    return list(_load_messages(message_type))
+
+@lru_cache(maxsize=None)
+def _load_messages(message_type):
+    """Read, clean and cache the messages for a type as a tuple.
+
+    The JSON files and the emoji decision (which may read /proc/version)
+    do not change while the process runs, so they are handled once per
+    message type instead of on every thinking/startup message.
+    """
     try:
-        # Get the directory where this utils.py file is located
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        if message_type == "startup":
-            json_path = os.path.join(current_dir, "startup.json")
-        elif message_type == "thinking":
-            json_path = os.path.join(current_dir, "thinking.json")
-        else:
-            return [">> Loading..."]
+        json_path = _MESSAGE_PATHS.get(message_type)
+        if json_path is None:
+            return (">> Loading...",)
         
         if os.path.exists(json_path):
             with open(json_path, "r", encoding="utf-8") as f:
@@ -182,7 +251,7 @@ def load_messages(message_type="startup"):
                     # Fallback message if Unicode issues
                     messages.append(">> Processing...")
             
-            return messages if messages else [">> Loading..."]
+            return tuple(messages) if messages else (">> Loading...",)
         
     except Exception as e:
         # Fallback messages if file loading fails
@@ -190,26 +259,25 @@ def load_messages(message_type="startup"):
     
     # Fallback messages
     if message_type == "startup":
-        return [
+        return (
             ">> Launching optimized Grok CLI...",
             ">> Powering up the efficiency engine...",
             ">> Advanced request management active...",
             ">> Smart batching and caching enabled..."
-        ]
+        )
     elif message_type == "thinking":
-        return [
+        return (
             ">> Grok is pondering your request...",
             ">> Computing the meaning of life... and your query...",
             ">> The mental circus is in full swing...",
             ">> Neurons are firing in chaotic patterns..."
-        ]
+        )
     else:
-        return [">> Processing..."]
+        return (">> Processing...",)
 
 def get_random_message(message_type="startup"):
     """Get a random message of the specified type."""
-    messages = load_messages(message_type)
-    message = random.choice(messages)
+    message = random.choice(_load_messages(message_type))
     
     # Handle display encoding issues
     try:
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for api_call's retry loop and rate-limit handling
+"""
+
+import os
+import sys
+
+import pytest
+import requests
+
+# Add the grok_cli package to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+from grok_cli import engine as engine_module
+from grok_cli.engine import GrokEngine
+
+MESSAGES = [{"role": "system", "content": "system"}, {"role": "user", "content": "hi"}]
+
+
+class CountingCounter:
+    """Stands in for TokenCounter and counts cost estimates."""
+
+    def __init__(self):
+        self.counted = 0
+
+    def count_messages_tokens(self, messages, model):
+        self.counted += 1
+        return 10
+
+    def estimate_cost(self, **kwargs):
+        return {"output_cost": 0.0}
+
+    def display_cost_warning(self, cost):
+        pass
+
+
+class OpenBucket:
+    """A rate limiter that never waits but counts reservations."""
+
+    def __init__(self):
+        self.reserved = 0
+
+    def reserve(self):
+        self.reserved += 1
+        return 0.0
+
+
+def _engine(monkeypatch):
+    engine = GrokEngine()
+    engine.xai_client = object()  # Skip client setup
+    engine.token_counter = CountingCounter()
+    engine.cost_tracking_enabled = True
+    engine._api_bucket = OpenBucket()
+    # Route every call through _api_call_requests
+    monkeypatch.setattr(engine_module, "XAI_SDK_AVAILABLE", False)
+    return engine
+
+
+def test_transient_failures_are_retried_without_recounting(monkeypatch):
+    """Retries loop: the cost estimate runs once, pacing once per attempt."""
+    engine = _engine(monkeypatch)
+    attempts = []
+
+    def flaky(key, messages, model, stream, tools, reasoning, retry_count):
+        attempts.append(retry_count)
+        if len(attempts) < 3:
+            raise RuntimeError("connection reset")
+        return "response"
+
+    engine._api_call_requests = flaky
+
+    assert engine.api_call("key", MESSAGES, "grok-4-0709", True) == "response"
+    assert attempts == [0, 1, 2]
+    assert engine.token_counter.counted == 1
+    assert engine._api_bucket.reserved == 3
+
+
+def test_gives_up_after_nine_attempts(monkeypatch):
+    engine = _engine(monkeypatch)
+    attempts = []
+
+    def failing(key, messages, model, stream, tools, reasoning, retry_count):
+        attempts.append(retry_count)
+        raise RuntimeError("down")
+
+    engine._api_call_requests = failing
+
+    with pytest.raises(Exception, match="after 8 attempts: down"):
+        engine.api_call("key", MESSAGES, "grok-4-0709", True)
+    assert attempts == list(range(9))
+    assert engine.token_counter.counted == 1
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.closed = False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(response=self)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.bodies = []
+
+    def post(self, url, headers=None, data=None, stream=False, timeout=None):
+        self.bodies.append(data)
+        return self.responses.pop(0)
+
+
+def test_rate_limited_requests_wait_and_resend_the_same_body(monkeypatch):
+    """429s honour Retry-After, release the connection and resend the body."""
+    engine = _engine(monkeypatch)
+    limited = [FakeResponse(429, {"Retry-After": "2"}), FakeResponse(429, {"Retry-After": "3"})]
+    session = FakeSession(limited + [FakeResponse(200)])
+    waits = []
+    monkeypatch.setattr(engine_module, "_SESSION", session)
+    monkeypatch.setattr(engine_module, "show_progress_bar", waits.append)
+
+    response = engine._api_call_requests("key", MESSAGES, "grok-4-0709", False, None, False, 0)
+
+    assert response.status_code == 200
+    assert waits == [2, 3]
+    assert all(r.closed for r in limited)
+    assert len(session.bodies) == 3 and len(set(session.bodies)) == 1
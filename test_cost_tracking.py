@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for how API usage blocks are turned into tracked token counts
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+# Add the grok_cli package to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+from grok_cli.engine import GrokEngine, _SDKResponseWrapper
+
+
+class RecordingCounter:
+    """Stands in for TokenCounter and records track_api_call arguments."""
+
+    def __init__(self):
+        self.calls = []
+
+    def track_api_call(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+def _tracking_engine():
+    engine = GrokEngine()
+    engine.token_counter = RecordingCounter()
+    engine.cost_tracking_enabled = True
+    return engine
+
+
+def test_cached_prompt_tokens_are_billed_separately():
+    """Cache hits come out of prompt_tokens and are tracked as cached tokens."""
+    engine = _tracking_engine()
+
+    engine.track_api_response({"usage": {
+        "prompt_tokens": 1000,
+        "completion_tokens": 50,
+        "prompt_tokens_details": {"cached_tokens": 800},
+    }}, "grok-4-0709")
+
+    call, = engine.token_counter.calls
+    assert call["input_tokens"] == 200
+    assert call["cached_tokens"] == 800
+    assert call["output_tokens"] == 50
+
+
+def test_usage_without_cache_details_bills_all_input():
+    """Without prompt_tokens_details every prompt token is regular input."""
+    engine = _tracking_engine()
+
+    engine.track_api_response({"usage": {"prompt_tokens": 300, "completion_tokens": 20}}, "grok-4-0709")
+
+    call, = engine.token_counter.calls
+    assert call["input_tokens"] == 300
+    assert call["cached_tokens"] == 0
+
+
+def test_sdk_wrapper_reports_cached_prompt_tokens():
+    """The SDK wrapper exposes the SDK's cached token count in the usage block."""
+    usage = SimpleNamespace(prompt_tokens=120, completion_tokens=30, cached_prompt_text_tokens=100)
+    wrapper = _SDKResponseWrapper(SimpleNamespace(content="hi", usage=usage))
+    engine = _tracking_engine()
+
+    engine.track_api_response(wrapper.json(), "grok-4-0709")
+
+    call, = engine.token_counter.calls
+    assert call["input_tokens"] == 20
+    assert call["cached_tokens"] == 100
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the engine's file tools
+"""
+
+import os
+import sys
+
+# Add the grok_cli package to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+from grok_cli.engine import GrokEngine
+
+
+def _engine(source_directory):
+    engine = GrokEngine()
+    engine.set_source_directory(str(source_directory))
+    return engine
+
+
+def _str_replace(engine, filename, old_str, new_str):
+    return engine._execute_tool_internal(
+        "str_replace", {"filename": str(filename), "old_str": old_str, "new_str": new_str}
+    )
+
+
+def test_str_replace_multiline_in_crlf_file(tmp_path):
+    """A multi-line old_str matches a CRLF file and its endings are kept."""
+    target = tmp_path / "crlf.txt"
+    target.write_bytes(b"foo\r\nbar\r\nbaz\r\n")
+
+    result = _str_replace(_engine(tmp_path), target, "foo\nbar", "one\ntwo\nthree")
+
+    assert result.get("success"), result
+    assert target.read_bytes() == b"one\r\ntwo\r\nthree\r\nbaz\r\n"
+
+
+def test_str_replace_replaces_every_occurrence(tmp_path):
+    """Every match is replaced, as the text-mode implementation did."""
+    target = tmp_path / "lf.txt"
+    target.write_bytes(b"a-b\na-b\n")
+
+    result = _str_replace(_engine(tmp_path), target, "a-b", "c")
+
+    assert result.get("success"), result
+    assert target.read_bytes() == b"c\nc\n"
+
+
+def test_str_replace_rejects_empty_old_str(tmp_path):
+    """An empty old_str is an error and leaves the file untouched."""
+    target = tmp_path / "file.txt"
+    target.write_bytes(b"content\n")
+
+    result = _str_replace(_engine(tmp_path), target, "", "x")
+
+    assert "error" in result
+    assert target.read_bytes() == b"content\n"
+
+
+def test_str_replace_reports_missing_string(tmp_path):
+    """A string that is not in the file is reported without writing."""
+    target = tmp_path / "file.txt"
+    target.write_bytes(b"foo\r\nbar\r\n")
+
+    result = _str_replace(_engine(tmp_path), target, "foo\nqux", "x")
+
+    assert "not found" in result["error"]
+    assert target.read_bytes() == b"foo\r\nbar\r\n"
+
+
+def test_ls_lists_names_and_subdirectories(tmp_path):
+    """ls keeps 'files' as sorted names and lists subdirectories in 'dirs'."""
+    listed = tmp_path / "listed"
+    listed.mkdir()
+    (listed / "b.txt").write_text("")
+    (listed / "a_dir").mkdir()
+    (listed / "c.py").write_text("")
+
+    result = _engine(tmp_path)._shell_ls([str(listed)])
+
+    assert result["files"] == ["a_dir", "b.txt", "c.py"]
+    assert result["dirs"] == ["a_dir"]
+
+
+def test_cd_into_symlink_reports_real_directory(tmp_path, monkeypatch):
+    """cd and pwd report the process directory, not the symlinked path."""
+    real = tmp_path / "real"
+    real.mkdir()
+    os.symlink(real, tmp_path / "link")
+    monkeypatch.chdir(tmp_path)
+    engine = _engine(tmp_path)
+
+    result = engine._shell_cd(["link"])
+
+    assert result["new_directory"] == os.getcwd() == os.path.realpath(real)
+    assert engine._shell_pwd([])["directory"] == os.getcwd()
+    assert engine._shell_cd([".."])["new_directory"] == os.path.realpath(tmp_path)
+
+
+def test_pwd_sees_cd_from_another_engine(tmp_path, monkeypatch):
+    """The working directory is process-wide, so engines never go stale."""
+    (tmp_path / "sub").mkdir()
+    monkeypatch.chdir(tmp_path)
+    first, second = _engine(tmp_path), _engine(tmp_path)
+    second._shell_pwd([])
+
+    first._shell_cd(["sub"])
+
+    assert second._shell_pwd([])["directory"] == os.path.realpath(tmp_path / "sub")
+    assert second._shell_cd([".."])["old_directory"] == os.path.realpath(tmp_path / "sub")
+
+
+def test_rm_recursive_tree_of_only_directories(tmp_path, monkeypatch):
+    """A large tree with no files is removed even when the thread pool is eligible."""
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    root = tmp_path / "empty_dirs"
+    for i in range(300):
+        (root / f"d{i}").mkdir(parents=True)
+
+    result = _engine(tmp_path)._shell_rm(["-r", str(root)])
+
+    assert result["results"][str(root)].get("success"), result
+    assert not root.exists()
+
+
+def test_rm_recursive_large_tree_with_files(tmp_path, monkeypatch):
+    """Files in a large tree are unlinked in batches before the directories go."""
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    root = tmp_path / "tree"
+    for i in range(20):
+        sub = root / f"d{i}"
+        sub.mkdir(parents=True)
+        for j in range(15):
+            (sub / f"f{j}.txt").write_text("x")
+
+    result = _engine(tmp_path)._shell_rm(["-r", str(root)])
+
+    assert result["results"][str(root)].get("success"), result
+    assert not root.exists()
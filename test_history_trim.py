@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for trimming the interactive chat history
+"""
+
+import os
+import sys
+
+# Add the grok_cli package to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+from grok_cli.cli import trim_history
+
+
+def _turn(n, with_tools=False):
+    """One user turn: the question, optional tool round trip, and the answer."""
+    messages = [{"role": "user", "content": f"question {n}"}]
+    if with_tools:
+        messages.append({"role": "assistant", "content": None, "tool_calls": [{"id": f"call_{n}"}]})
+        messages.append({"role": "tool", "tool_call_id": f"call_{n}", "content": "{}"})
+    messages.append({"role": "assistant", "content": f"answer {n}"})
+    return messages
+
+
+def _history(turns, with_tools=False):
+    history = [{"role": "system", "content": "system"}]
+    for n in range(turns):
+        history.extend(_turn(n, with_tools))
+    return history
+
+
+def test_short_history_is_untouched():
+    history = _history(3)
+    original = list(history)
+
+    assert trim_history(history, max_messages=10) == 0
+    assert history == original
+
+
+def test_oldest_turns_are_dropped_and_system_kept():
+    history = _history(10)
+
+    dropped = trim_history(history, max_messages=9)
+
+    assert dropped == 12
+    assert len(history) == 9
+    assert history[0]["role"] == "system"
+    assert history[1] == {"role": "user", "content": "question 6"}
+    assert history[-1] == {"role": "assistant", "content": "answer 9"}
+
+
+def test_tool_results_stay_with_their_request():
+    """The kept window starts at a user message, never inside a tool round trip."""
+    history = _history(6, with_tools=True)
+
+    trim_history(history, max_messages=7)
+
+    assert history[1]["role"] == "user"
+    tool_ids = {m["tool_call_id"] for m in history if m["role"] == "tool"}
+    requested = {c["id"] for m in history if m.get("tool_calls") for c in m["tool_calls"]}
+    assert tool_ids == requested
+
+
+def test_current_turn_is_kept_whole():
+    """A single turn longer than the limit is not cut, but earlier turns go."""
+    history = _history(2, with_tools=True)
+    history[-1:-1] = _turn(2, with_tools=True)[1:3] * 2
+    current = history[5:]
+
+    assert trim_history(history, max_messages=3) == 4
+    assert history[1:] == current
+    assert history[1] == {"role": "user", "content": "question 1"}
+
+
+def test_lone_oversized_turn_is_untouched():
+    history = _history(1, with_tools=True)
+    history[-1:-1] = _turn(1, with_tools=True)[1:3] * 2
+    original = list(history)
+
+    assert trim_history(history, max_messages=3) == 0
+    assert history == original
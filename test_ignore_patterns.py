@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the engine's .gitignore matcher and list_files_recursive tool
+"""
+
+import fnmatch
+import os
+import random
+import sys
+
+import pytest
+
+# Add the grok_cli package to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+from grok_cli.engine import GrokEngine, _compile_ignore_patterns
+
+
+def _legacy_should_ignore(path, patterns):
+    """The original GrokEngine._should_ignore, kept to compare behaviour."""
+    for pattern in patterns:
+        if pattern.endswith('/'):
+            if path.startswith(pattern) or ('/' + pattern) in path:
+                return True
+        elif pattern in path or path.endswith(pattern):
+            return True
+        elif '*' in pattern:
+            if fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(os.path.basename(path), pattern):
+                return True
+    return False
+
+
+def _legacy_listing(directory, patterns):
+    """List files the way the original os.walk based tool did."""
+    listed = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if not _legacy_should_ignore(os.path.join(root, d), patterns)]
+        for name in files:
+            relative_path = os.path.relpath(os.path.join(root, name), directory)
+            if not _legacy_should_ignore(relative_path, patterns):
+                listed.append(relative_path)
+    return listed
+
+
+PATTERNS = [
+    "__pycache__/", "*.py[cod]", "*.egg-info/", ".env", "build/", "dist/",
+    "a*b", "x?z", "[ab]*.log", ".*", "foo.bar", "*.log", "node_modules",
+]
+ALPHABET = ["a", "b", "x", "z", "/", ".", "py", "c", "log", "build", "egg-info",
+            "_", "foo", "bar", "node_modules", "*", "[", "]", "?", "env"]
+
+
+def test_matcher_agrees_with_original_on_random_paths():
+    """Random paths and pattern sets are ignored exactly as before."""
+    rng = random.Random(1)
+    for _ in range(20000):
+        path = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 8)))
+        patterns = tuple(rng.sample(PATTERNS, rng.randint(0, 6)))
+        is_ignored = _compile_ignore_patterns(patterns)
+        assert is_ignored(path) == _legacy_should_ignore(path, patterns), (path, patterns)
+        name = path.rpartition("/")[2]
+        assert is_ignored(path, name) == _legacy_should_ignore(path, patterns), (path, patterns)
+
+
+TREE = [
+    "app.py",
+    "app.pyc",
+    ".env",
+    "notes.log",
+    "pkg/module.py",
+    "pkg/__pycache__/module.cpython-311.pyc",
+    "pkg/foo.bar.txt",
+    "build/out.txt",
+    "docs/build/index.html",
+    "grok_cli.egg-info/PKG-INFO",
+    "sub/deep/axb.txt",
+    "sub/deep/keep.txt",
+]
+
+
+@pytest.mark.parametrize("gitignore", [
+    "",
+    "__pycache__/\n*.py[cod]\n",
+    "build/\n*.egg-info/\n.env\n",
+    "# comment\n\n*.log\nfoo.bar\na*b\n",
+])
+def test_list_files_matches_original_walk(tmp_path, monkeypatch, gitignore):
+    for path in TREE:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text("")
+    (tmp_path / ".gitignore").write_text(gitignore)
+    monkeypatch.chdir(tmp_path)
+    engine = GrokEngine()
+    engine.set_source_directory(str(tmp_path))
+    patterns = [l.strip() for l in gitignore.splitlines() if l.strip() and not l.startswith("#")]
+
+    result = engine._execute_tool_internal("list_files_recursive", {"directory": "."})
+
+    assert result["files"] == _legacy_listing(".", patterns)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the token-bucket rate limiter
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+# Add the grok_cli package to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+from grok_cli import request_manager
+from grok_cli.request_manager import TokenBucket
+
+
+class FakeClock:
+    """A monotonic clock that only moves when told to, and records sleeps."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(request_manager.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(request_manager.time, "sleep", fake.sleep)
+    return fake
+
+
+def test_burst_goes_out_without_waiting(clock):
+    bucket = TokenBucket(rate=1.0, burst=3)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+
+def test_calls_beyond_the_burst_are_spaced_at_the_rate(clock):
+    """Each extra reservation waits one more interval than the last."""
+    bucket = TokenBucket(rate=2.0, burst=1)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_tokens_refill_over_time_up_to_the_burst(clock):
+    bucket = TokenBucket(rate=1.0, burst=2)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now += 10  # Far longer than needed to refill two tokens
+
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_acquire_sleeps_only_when_empty(clock):
+    bucket = TokenBucket(rate=4.0, burst=1)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.25)
+    assert clock.sleeps == [pytest.approx(0.25)]
+
+
+def test_concurrent_reservations_are_queued(clock):
+    """Threads that find the bucket empty each get a distinct wait."""
+    bucket = TokenBucket(rate=1.0, burst=1)
+    waits = []
+    lock = threading.Lock()
+
+    def reserve():
+        wait = bucket.reserve()
+        with lock:
+            waits.append(wait)
+
+    threads = [threading.Thread(target=reserve) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(waits) == [pytest.approx(w) for w in (0.0, 1.0, 2.0, 3.0, 4.0)]
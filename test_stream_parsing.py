@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for parsing streamed chat completions
+"""
+
+import json
+import os
+import sys
+
+# Add the grok_cli package to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+from grok_cli.engine import GrokEngine, _iter_sse_data, _truncate_to_complete_json
+
+
+class ChunkedResponse:
+    """A requests-like response whose body arrives in the given chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def iter_content(self, chunk_size=1):
+        return iter(self.chunks)
+
+
+def _split(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+SSE_BODY = (
+    b": keep-alive comment\n"
+    b"event: message\n"
+    b'data: {"a":1}\n'
+    b"\n"
+    b'data:{"b":2}\r\n'
+    b"\r\n"
+    b"id: 7\n"
+    b"data: [DONE]\n"
+)
+
+
+def test_sse_data_lines_are_yielded_in_order():
+    """Only data: payloads come out, with or without a space and with CRLF."""
+    payloads = list(_iter_sse_data(ChunkedResponse([SSE_BODY])))
+
+    assert payloads == [b'{"a":1}', b'{"b":2}', b"[DONE]"]
+
+
+def test_sse_lines_split_across_reads():
+    """Lines cut at any byte boundary are reassembled, empty reads ignored."""
+    expected = list(_iter_sse_data(ChunkedResponse([SSE_BODY])))
+
+    for size in range(1, len(SSE_BODY) + 1):
+        chunks = []
+        for piece in _split(SSE_BODY, size):
+            chunks += [piece, b""]
+        assert list(_iter_sse_data(ChunkedResponse(chunks))) == expected, size
+
+
+def test_sse_last_line_without_newline():
+    """A final data line with no trailing newline is still yielded."""
+    payloads = list(_iter_sse_data(ChunkedResponse([b'data: {"a":1}\ndata: [DONE]'])))
+
+    assert payloads == [b'{"a":1}', b"[DONE]"]
+
+
+def test_truncate_keeps_first_complete_object():
+    """Trailing garbage or a second object after valid arguments is cut off."""
+    assert _truncate_to_complete_json('{"filename": "a.py"}{"filename": "b') == '{"filename": "a.py"}'
+    assert _truncate_to_complete_json('  {"a": [1, {"b": 2}]} trailing') == '{"a": [1, {"b": 2}]}'
+
+
+def test_truncate_ignores_braces_inside_strings():
+    """Braces and escaped quotes in string values do not end the object."""
+    text = '{"content": "def f():\\n    return {\\"x\\": \\"}\\"}"}}'
+    fixed = _truncate_to_complete_json(text)
+
+    assert fixed == text[:-1]
+    assert json.loads(fixed)["content"].endswith('"}"}')
+
+
+def test_truncate_brace_scan_fallback():
+    """Invalid JSON still gets cut at the end of its first balanced object."""
+    assert _truncate_to_complete_json('{"a": "}", b} extra') == '{"a": "}", b}'
+    assert _truncate_to_complete_json('{"a": nope} {"b": 1}') == '{"a": nope}'
+
+
+def test_truncate_returns_unfinished_text_unchanged():
+    """With no complete object the original text is returned as is."""
+    assert _truncate_to_complete_json(' {"a": "unfinished ') == ' {"a": "unfinished '
+
+
+def _sse(*payloads):
+    """Encode chunk dicts (or raw strings) as an SSE body ending in [DONE]."""
+    lines = []
+    for payload in payloads:
+        data = payload if isinstance(payload, str) else json.dumps(payload)
+        lines.append(f"data: {data}\n\n")
+    lines.append("data: [DONE]\n\n")
+    return "".join(lines).encode("utf-8")
+
+
+def _content(text):
+    return {"choices": [{"delta": {"content": text}}]}
+
+
+def _tool_delta(index, **fields):
+    return {"choices": [{"delta": {"tool_calls": [dict(index=index, **fields)]}}]}
+
+
+def test_stream_collects_content_and_tool_calls(capsys):
+    """Text is echoed and joined; tool call fragments are merged by index."""
+    body = _sse(
+        _content("Hello"),
+        _content(", world\n"),
+        _tool_delta(0, id="call_1", type="function",
+                    function={"name": "read_file", "arguments": '{"filen'}),
+        _tool_delta(1, id="call_2", function={"name": "list_files_recursive", "arguments": ""}),
+        _tool_delta(0, function={"arguments": 'ame": "a.py"}'}),
+        _tool_delta(1, function={"arguments": '{"directory": "."}'}),
+    )
+    engine = GrokEngine()
+
+    content, tool_calls, _ = engine.handle_stream_with_tools(ChunkedResponse(_split(body, 7)))
+
+    assert content == "Hello, world\n"
+    assert capsys.readouterr().out.startswith("Hello, world\n")
+    assert [(c["id"], c["function"]["name"], json.loads(c["function"]["arguments"])) for c in tool_calls] == [
+        ("call_1", "read_file", {"filename": "a.py"}),
+        ("call_2", "list_files_recursive", {"directory": "."}),
+    ]
+
+
+def test_stream_skips_malformed_chunks():
+    """Undecodable chunks and chunks without choices are skipped."""
+    body = _sse(_content("a"), "{not json", {"choices": []}, {"choices": [{}]}, _content("b"))
+
+    content, tool_calls, _ = GrokEngine().handle_stream_with_tools(ChunkedResponse([body]))
+
+    assert content == "ab"
+    assert tool_calls == []
+
+
+def test_stream_repairs_tool_arguments_with_trailing_garbage():
+    """Arguments followed by a partial second object are cut to the first."""
+    body = _sse(_tool_delta(0, id="call_1", function={
+        "name": "read_file", "arguments": '{"filename": "a.py"}{"filename": "b'}))
+
+    _, tool_calls, _ = GrokEngine().handle_stream_with_tools(ChunkedResponse([body]))
+
+    assert tool_calls[0]["function"]["arguments"] == '{"filename": "a.py"}'
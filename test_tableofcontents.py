@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for the table of contents generator's file walk
+"""
+
+import fnmatch
+import os
+import sys
+
+import pytest
+
+# Add the project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+import create_tableofcontents as toc
+
+
+def _walk_listing(directory):
+    """List files the way the original os.walk based implementation did."""
+    listed = []
+    for root, dirs, files in os.walk(directory):
+        for name in files:
+            listed.append(os.path.relpath(os.path.join(root, name), directory))
+    return sorted(listed)
+
+
+def _legacy_should_ignore(path, patterns):
+    """The original substring-based matcher, kept to compare behaviour."""
+    for pattern in patterns:
+        if pattern.endswith('/'):
+            if path.startswith(pattern) or ('/' + pattern) in path:
+                return True
+        elif pattern in path or path.endswith(pattern):
+            return True
+        elif '*' in pattern:
+            if fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(os.path.basename(path), pattern):
+                return True
+    return False
+
+
+def _legacy_listing(directory, patterns):
+    """List files the way the original implementation did, .gitignore included."""
+    listed = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if not _legacy_should_ignore(os.path.join(root, d), patterns)]
+        for name in files:
+            relative_path = os.path.relpath(os.path.join(root, name), directory)
+            if not _legacy_should_ignore(relative_path, patterns):
+                listed.append(relative_path)
+    return sorted(listed)
+
+
+TREE = [
+    "Cargo.lock",
+    "Cargo.lock.bak",
+    "sub/Cargo.lock",
+    "src/app.py",
+    "src/app.pyc",
+    "src/debug_utils.py",
+    "src/notes.log",
+    "src/deep/trace.log",
+    "target/out.txt",
+    "docs/target/index.html",
+    "lib/target.py",
+]
+
+# (.gitignore line, paths it ignores, whether the original matcher agreed)
+GITIGNORE_CASES = [
+    # Plain names match whole basenames anywhere in the tree
+    ("Cargo.lock", {"Cargo.lock", "sub/Cargo.lock"}, False),
+    ("debug", set(), False),
+    # Directory patterns prune the directory at any depth
+    ("target/", {"target/out.txt", "docs/target/index.html"}, True),
+    # A leading slash anchors the pattern to the root of the walk
+    ("/target", {"target/out.txt"}, False),
+    # Globs without a slash match basenames, globs with one match the path
+    ("*.pyc", {"src/app.pyc"}, True),
+    ("*.log", {"src/notes.log", "src/deep/trace.log"}, True),
+    # In a glob with a slash, '*' stays within one directory and '**' spans any
+    ("src/*.log", {"src/notes.log"}, False),
+    ("src/**/*.log", {"src/notes.log", "src/deep/trace.log"}, False),
+    ("/*.log", set(), True),
+    ("src/app.p?", {"src/app.py"}, False),
+]
+
+
+@pytest.mark.parametrize("pattern, ignored, legacy_agrees", GITIGNORE_CASES)
+def test_gitignore_patterns(tmp_path, monkeypatch, pattern, ignored, legacy_agrees):
+    """Each kind of pattern ignores what git would, compared with the old matcher."""
+    for path in TREE:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text("")
+    (tmp_path / ".gitignore").write_text(pattern + "\n")
+    monkeypatch.chdir(tmp_path)
+
+    expected = sorted(os.path.normpath(p) for p in TREE + [".gitignore"] if p not in ignored)
+    legacy = _legacy_listing(".", [pattern])
+    listed = sorted(toc.list_files_recursive("."))
+
+    assert listed == expected
+    # Plain names used to match as substrings, '/anchored' patterns never
+    # matched at the root, only '*' made a pattern a glob and '*' crossed
+    # '/'; those cases differ from the old matcher on purpose
+    assert (listed == legacy) == legacy_agrees
+
+
+def test_list_files_matches_os_walk_with_symlinks(tmp_path, monkeypatch):
+    """Symlinked files are listed and symlinked directories are not descended."""
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "module.py").write_text("x = 1\n")
+    (tmp_path / "README.md").write_text("readme\n")
+    os.symlink(tmp_path / "README.md", tmp_path / "linked_readme.md")
+    os.symlink(tmp_path / "pkg", tmp_path / "linked_pkg")
+    os.symlink(tmp_path / "missing.txt", tmp_path / "dangling.txt")
+    monkeypatch.chdir(tmp_path)
+
+    listed = sorted(toc.list_files_recursive("."))
+
+    assert listed == _walk_listing(".")
+    assert "linked_readme.md" in listed
+    assert os.path.join("linked_pkg", "module.py") not in listed
+
+
+def test_listing_leaves_no_files_behind(tmp_path, monkeypatch):
+    """Reading .gitignore writes nothing into the project tree."""
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    (tmp_path / "app.py").write_text("")
+    monkeypatch.chdir(tmp_path)
+
+    assert sorted(toc.list_files_recursive(".")) == [".gitignore", "app.py"]
+    assert sorted(os.listdir(tmp_path)) == [".gitignore", "app.py"]
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared token count cache
+"""
+
+import os
+import sys
+from collections import OrderedDict
+
+import pytest
+
+# Add the grok_cli package to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+from grok_cli import tokenCount
+from grok_cli.tokenCount import _count_cached, token_cache_info
+
+
+class SplittingEncoder:
+    """Stands in for tiktoken: one token per word, counting encode calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text):
+        self.calls += 1
+        return text.split()
+
+
+@pytest.fixture
+def encoder(monkeypatch):
+    fake = SplittingEncoder()
+    monkeypatch.setattr(tokenCount, "_get_encoder", lambda: fake)
+    monkeypatch.setattr(tokenCount, "_token_counts", OrderedDict())
+    monkeypatch.setattr(tokenCount, "_token_cache_stats", [0, 0])
+    return fake
+
+
+def test_repeated_text_is_counted_once(encoder):
+    assert _count_cached("one two three") == 3
+    assert _count_cached("one two three") == 3
+    assert _count_cached("one two") == 2
+
+    info = token_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+    assert encoder.calls == 2
+
+
+def test_cache_does_not_keep_the_text(encoder):
+    """Entries are keyed by length and digest, so large bodies are not pinned."""
+    text = "word " * 100000
+
+    assert _count_cached(text) == 100000
+
+    key, = tokenCount._token_counts
+    assert key[0] == len(text)
+    assert not any(isinstance(part, str) for part in key)
+
+
+def test_least_recently_used_entry_is_evicted(encoder, monkeypatch):
+    monkeypatch.setattr(tokenCount, "TOKEN_CACHE_SIZE", 2)
+    _count_cached("a")
+    _count_cached("b")
+    _count_cached("a")
+    _count_cached("c")  # Evicts "b"
+
+    _count_cached("a")
+    _count_cached("b")
+
+    assert encoder.calls == 4
+    assert token_cache_info().currsize == 2
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for running one turn's tool calls in _dispatch_tool_calls
+"""
+
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+# Add the grok_cli package to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
+
+from grok_cli.engine import GrokEngine
+
+
+def _tool_call(call_id, name, **arguments):
+    return {"id": call_id, "type": "function",
+            "function": {"name": name, "arguments": json.dumps(arguments)}}
+
+
+@pytest.mark.parametrize("capture_output", [False, True])
+def test_adjacent_read_only_calls_overlap_in_order(capture_output):
+    """Adjacent reads run together, never overtake a write, and keep their order."""
+    engine = GrokEngine()
+    # All three reads must be running at once to get past the barrier
+    barrier = threading.Barrier(3, timeout=5)
+    events = []
+
+    def fake_tool(name, arguments, brave_api_key=None):
+        if name == "read_file" and arguments["filename"] != "after.txt":
+            barrier.wait()
+        events.append((name, arguments["filename"]))
+        return {"success": True, "filename": arguments["filename"]}
+
+    engine._execute_tool_internal = fake_tool
+    tool_calls = [
+        _tool_call("call_a", "read_file", filename="a.txt"),
+        _tool_call("call_b", "read_file", filename="b.txt"),
+        _tool_call("call_c", "read_file", filename="c.txt"),
+        _tool_call("call_w", "create_file", filename="w.txt", content=""),
+        _tool_call("call_d", "read_file", filename="after.txt"),
+    ]
+    messages = []
+
+    failures, _ = engine._dispatch_tool_calls(tool_calls, messages, None, False,
+                                              capture_output=capture_output)
+
+    if not capture_output:
+        assert failures == 0
+    assert [m["tool_call_id"] for m in messages] == ["call_a", "call_b", "call_c", "call_w", "call_d"]
+    for message in messages[:3]:
+        assert json.loads(message["content"])["success"]
+    assert json.loads(messages[4]["content"])["filename"] == "after.txt"
+    # The reads before the write all finished first; the read after it ran last
+    reads_before = {("read_file", name) for name in ("a.txt", "b.txt", "c.txt")}
+    assert set(events[:3]) == reads_before
+    assert events[-1] == ("read_file", "after.txt")